@@ -0,0 +1,137 @@
+"""
+Load test roll latency while listings overload the server, with and
+without admission control, on a SQLite file
+
+SQLite serialises writers, so a single client rolls. A roll that fails,
+e.g. with "database is locked" while readers hold the file, counts as an
+error. Listing clients back off for Retry-After when rejected.
+
+    python benchmarks/bench_admission.py
+"""
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from utils import create_large_game, percentile, setup_django
+
+
+DURATION = 5
+ROLL_CLIENTS = 1
+LIST_CLIENTS = (0, 8, 32)
+GAMES = 200
+
+
+def roll_client(stop, latencies, errors):
+    from django.db import connection
+    from django.test import Client
+
+    from scoring.serializers import CreateGameSerializer
+
+    client = Client()
+
+    while not stop.is_set():
+        serializer = CreateGameSerializer(data={'player_names': ['player']})
+        serializer.is_valid(raise_exception=True)
+        game = serializer.save()
+        path = '/games/{}/roll/'.format(game.id)
+        data = {'player_id': game.players.get().id, 'pins_knocked_down': 4}
+
+        for _ in range(20):
+            if stop.is_set():
+                break
+
+            start = time.perf_counter()
+            try:
+                status_code = client.post(path, data).status_code
+            except Exception:
+                status_code = None
+            latencies.append(time.perf_counter() - start)
+
+            if status_code != 201:
+                errors.append(status_code)
+
+    connection.close()
+
+
+def list_client(stop, statuses):
+    from django.db import connection
+    from django.test import Client
+
+    client = Client()
+
+    while not stop.is_set():
+        response = client.get('/games/')
+        statuses.append(response.status_code)
+
+        if response.has_header('Retry-After'):
+            stop.wait(int(response['Retry-After']))
+
+    connection.close()
+
+
+def run(list_clients):
+    """
+    Return roll latencies, roll errors and listing status codes
+    """
+    stop = threading.Event()
+    latencies, errors, statuses = [], [], []
+    threads = [
+        threading.Thread(target=roll_client, args=(stop, latencies, errors))
+        for _ in range(ROLL_CLIENTS)
+    ] + [
+        threading.Thread(target=list_client, args=(stop, statuses))
+        for _ in range(list_clients)
+    ]
+
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return latencies, errors, statuses
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    setup_django(database_name=os.path.join(directory, 'bench.sqlite3'))
+    logging.getLogger('django.request').setLevel(logging.CRITICAL)
+
+    from django.conf import settings
+    from django.test.utils import override_settings
+
+    for _ in range(GAMES):
+        create_large_game(10)
+
+    row = '{:<10} {:>6} {:>6} {:>7} {:>9} {:>9} {:>9} {:>9}'
+    print(
+        row.format(
+            'admission', 'lists', 'rolls', 'errors', 'p50 (ms)', 'p99 (ms)',
+            'list 200', 'list 503'
+        )
+    )
+    for enabled in (False, True):
+        admission_control = dict(settings.ADMISSION_CONTROL, ENABLED=enabled)
+
+        with override_settings(ADMISSION_CONTROL=admission_control):
+            for list_clients in LIST_CLIENTS:
+                latencies, errors, statuses = run(list_clients)
+                print(
+                    row.format(
+                        'on' if enabled else 'off',
+                        list_clients,
+                        len(latencies) - len(errors),
+                        len(errors),
+                        '{:.1f}'.format(percentile(latencies, 0.5) * 1000),
+                        '{:.1f}'.format(percentile(latencies, 0.99) * 1000),
+                        statuses.count(200),
+                        statuses.count(503)
+                    )
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare rolls/s and p99 latency of applying each Roll in its own
+transaction against the group commit RollWriter, on a SQLite file
+
+    python benchmarks/bench_group_commit.py
+"""
+import os
+import tempfile
+import threading
+import time
+
+from utils import percentile, setup_django
+
+
+ROLLS_PER_CLIENT = 20
+
+
+def run(clients, roll):
+    """
+    Make ROLLS_PER_CLIENT open Rolls from each client thread, one Player
+    per client, with roll(game_id, player_id, pins_knocked_down)
+    Return rolls/s, p99 latency in ms and the number of errors
+    """
+    from django.db import connection
+
+    from scoring.serializers import CreateGameSerializer
+
+    serializer = CreateGameSerializer(
+        data={'player_names': ['player'] * clients}
+    )
+    serializer.is_valid(raise_exception=True)
+    game = serializer.save()
+    player_ids = list(game.players.values_list('id', flat=True))
+
+    latencies = []
+    errors = []
+    barrier = threading.Barrier(clients)
+
+    def client(player_id):
+        barrier.wait()
+        for _ in range(ROLLS_PER_CLIENT):
+            start = time.perf_counter()
+            try:
+                roll(game.id, player_id, 4)
+            except Exception as exc:
+                errors.append(exc)
+            latencies.append(time.perf_counter() - start)
+        connection.close()
+
+    threads = [
+        threading.Thread(target=client, args=(player_id,))
+        for player_id in player_ids
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return (
+        (len(latencies) - len(errors)) / elapsed,
+        percentile(latencies, 0.99) * 1000,
+        len(errors)
+    )
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    setup_django(database_name=os.path.join(directory, 'bench.sqlite3'))
+
+    from scoring.group_commit import RollWriter
+    from scoring.rolls import apply_roll
+
+    writers = [RollWriter(interval=interval) for interval in (0.002, 0)]
+
+    def group_commit(writer):
+        def roll(*args):
+            return writer.submit(*args).result(timeout=30)
+        return roll
+
+    paths = [('transaction', apply_roll)] + [
+        (
+            'group {:g}ms'.format(writer.interval * 1000),
+            group_commit(writer)
+        )
+        for writer in writers
+    ]
+
+    print(
+        '{:>8} {:<14} {:>10} {:>10} {:>8}'.format(
+            'clients', 'path', 'rolls/s', 'p99 (ms)', 'errors'
+        )
+    )
+    for clients in (1, 4, 16, 64):
+        for name, roll in paths:
+            rate, p99, errors = run(clients, roll)
+            print(
+                '{:>8} {:<14} {:>10.0f} {:>10.1f} {:>8}'.format(
+                    clients, name, rate, p99, errors
+                )
+            )
+
+    for writer in writers:
+        writer.stop()
+
+
+if __name__ == '__main__':
+    main()
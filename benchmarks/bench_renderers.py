@@ -0,0 +1,52 @@
+"""
+Compare payload size and encode time of the response formats
+
+    python benchmarks/bench_renderers.py
+"""
+from utils import best_of, create_game, setup_django
+
+
+def main():
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from scoring.renderers import (
+        MessagePackRenderer,
+        PackedJSONRenderer,
+        PackedMessagePackRenderer
+    )
+    from scoring.serializers import GameSerializer
+
+    renderers = (
+        JSONRenderer(),
+        MessagePackRenderer(),
+        PackedJSONRenderer(),
+        PackedMessagePackRenderer()
+    )
+
+    print(
+        '{:>8} {:<40} {:>10} {:>8} {:>12}'.format(
+            'players', 'media type', 'bytes', 'ratio', 'encode (us)'
+        )
+    )
+    for player_count in (1, 4, 40):
+        data = GameSerializer(create_game(player_count)).data
+        baseline = len(JSONRenderer().render(data))
+
+        for renderer in renderers:
+            size = len(renderer.render(data))
+            seconds = best_of(lambda: renderer.render(data), number=200)
+            print(
+                '{:>8} {:<40} {:>10} {:>8.2f} {:>12.1f}'.format(
+                    player_count,
+                    renderer.media_type,
+                    size,
+                    size / baseline,
+                    seconds * 1e6
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
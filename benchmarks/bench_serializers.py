@@ -0,0 +1,60 @@
+"""
+Compare serialization throughput of GameSerializer and fast_serializers
+
+    python benchmarks/bench_serializers.py
+"""
+from utils import best_of, create_game, setup_django
+
+
+def main():
+    setup_django()
+
+    from scoring.fast_serializers import serialize_game, serialize_games
+    from scoring.models import Game
+    from scoring.serializers import GameSerializer
+
+    print(
+        '{:<24} {:>16} {:>14} {:>8}'.format(
+            'case', 'GameSerializer/s', 'fast/s', 'speedup'
+        )
+    )
+
+    for player_count in (1, 4, 40):
+        game = create_game(player_count)
+        cases = (
+            (
+                'game, {} players'.format(player_count),
+                lambda: GameSerializer(game).data,
+                lambda: serialize_game(game)
+            ),
+        )
+        report(cases)
+
+    queryset = Game.objects.all()
+    report(
+        (
+            (
+                '{} games'.format(queryset.count()),
+                lambda: GameSerializer(queryset, many=True).data,
+                lambda: serialize_games(queryset)
+            ),
+        )
+    )
+
+
+def report(cases):
+    for name, slow, fast in cases:
+        slow_seconds = best_of(slow, number=20)
+        fast_seconds = best_of(fast, number=20)
+        print(
+            '{:<24} {:>16.1f} {:>14.1f} {:>8.1f}'.format(
+                name,
+                1 / slow_seconds,
+                1 / fast_seconds,
+                slow_seconds / fast_seconds
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Compare cold start time and per-request overhead of scoring.settings and
+the API only scoring.settings_api
+
+    python benchmarks/bench_startup.py
+"""
+import logging
+import os
+import subprocess
+import sys
+import time
+
+from utils import BASE_DIR, best_of, create_game, setup_django
+
+
+SETTINGS_MODULES = ('scoring.settings', 'scoring.settings_api')
+
+STARTUP_SCRIPT = '''
+import importlib
+import time
+start = time.perf_counter()
+from scoring.wsgi import application
+from django.conf import settings
+importlib.import_module(settings.ROOT_URLCONF)
+print(time.perf_counter() - start)
+'''
+
+
+def startup(settings_module, runs=10):
+    """
+    Start fresh interpreters loading the WSGI application and URLconf
+    Return the fastest seconds spent in process and in Django setup
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    process_times = []
+    setup_times = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.check_output(
+            [sys.executable, '-c', STARTUP_SCRIPT], cwd=BASE_DIR, env=env
+        )
+        process_times.append(time.perf_counter() - start)
+        setup_times.append(float(output))
+
+    return min(process_times), min(setup_times)
+
+
+def request_overhead(settings_module):
+    """
+    Time requests through the full middleware stack in a fresh interpreter
+    Return the best seconds per request for a Game and for a missing Game
+    """
+    output = subprocess.check_output(
+        [sys.executable, __file__, '--requests', settings_module],
+        cwd=BASE_DIR
+    )
+    return [float(seconds) for seconds in output.split()]
+
+
+def time_requests(settings_module):
+    setup_django(settings_module)
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+
+    from django.test import Client
+
+    client = Client()
+    path = '/games/{}/'.format(create_game(1).id)
+    print(best_of(lambda: client.get(path), number=200))
+    print(best_of(lambda: client.get('/games/0/'), number=200))
+
+
+def main():
+    print(
+        '{:<24} {:>12} {:>12} {:>14} {:>14}'.format(
+            'settings', 'process (ms)', 'setup (ms)', 'game (us)',
+            'missing (us)'
+        )
+    )
+    for settings_module in SETTINGS_MODULES:
+        process_seconds, setup_seconds = startup(settings_module)
+        game_seconds, missing_seconds = request_overhead(settings_module)
+        print(
+            '{:<24} {:>12.1f} {:>12.1f} {:>14.1f} {:>14.1f}'.format(
+                settings_module,
+                process_seconds * 1000,
+                setup_seconds * 1000,
+                game_seconds * 1e6,
+                missing_seconds * 1e6
+            )
+        )
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--requests']:
+        time_requests(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,76 @@
+"""
+Compare peak memory and time to first byte of retrieving a Game with
+10k Players in one response and streamed
+
+    python benchmarks/bench_streaming.py
+"""
+import resource
+import subprocess
+import sys
+import time
+
+from utils import BASE_DIR, create_large_game, setup_django
+
+
+PLAYER_COUNT = 10000
+
+
+def measure(mode):
+    """
+    Retrieve the Game in a fresh interpreter
+    Print seconds to first byte, total seconds, bytes and the growth of
+    peak RSS in KiB
+    """
+    setup_django()
+
+    from django.test import Client
+
+    path = '/games/{}/'.format(create_large_game(PLAYER_COUNT).id)
+    if mode == 'stream':
+        path += '?stream=true'
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    response = Client().get(path)
+
+    if response.streaming:
+        content = iter(response.streaming_content)
+        size = len(next(content))
+        first_byte = time.perf_counter() - start
+        size += sum(len(chunk) for chunk in content)
+    else:
+        first_byte = time.perf_counter() - start
+        size = len(response.content)
+
+    total = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    print(first_byte, total, size, peak)
+
+
+def main():
+    print(
+        '{:<8} {:>10} {:>10} {:>12} {:>14}'.format(
+            'mode', 'TTFB (ms)', 'total (ms)', 'bytes', 'peak RSS (KiB)'
+        )
+    )
+    for mode in ('full', 'stream'):
+        output = subprocess.check_output(
+            [sys.executable, __file__, '--measure', mode], cwd=BASE_DIR
+        )
+        first_byte, total, size, peak = output.split()
+        print(
+            '{:<8} {:>10.1f} {:>10.1f} {:>12} {:>14}'.format(
+                mode,
+                float(first_byte) * 1000,
+                float(total) * 1000,
+                int(size),
+                int(peak)
+            )
+        )
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--measure']:
+        measure(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,138 @@
+"""
+Helpers shared by the benchmark scripts
+
+Each script is run from the base directory, e.g.
+`python benchmarks/bench_renderers.py`
+"""
+import os
+import random
+import sys
+import timeit
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+
+def setup_django(settings_module='scoring.settings', database_name=None):
+    """
+    Configure Django and create a throwaway test database, in memory
+    unless a database_name file is given
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+
+    import django
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    if database_name is not None:
+        connection.settings_dict['TEST']['NAME'] = database_name
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def create_game(player_count, rolls_per_player=21, seed=0):
+    """
+    Create a Game and play up to rolls_per_player random Rolls per Player
+    """
+    from scoring.serializers import CreateGameSerializer
+
+    rng = random.Random(seed)
+    serializer = CreateGameSerializer(
+        data={
+            'player_names': [
+                'player_{}'.format(index) for index in range(player_count)
+            ]
+        }
+    )
+    serializer.is_valid(raise_exception=True)
+    game = serializer.save()
+
+    for player in game.players.all():
+        pins_standing = 10
+
+        for _ in range(rolls_per_player):
+            pins_knocked_down = rng.randint(0, pins_standing)
+            roll = player.make_roll(pins_knocked_down)
+
+            if roll is None:
+                break
+
+            pins_standing -= pins_knocked_down
+            if pins_standing == 0 or (
+                roll.roll_number == 2 and roll.frame.frame_number < 10
+            ):
+                pins_standing = 10
+
+    game.update_is_ongoing()
+    return game
+
+
+def create_large_game(player_count, chunk_size=500):
+    """
+    Create a finished Game of open frames with bulk inserts, chunk_size
+    Players at a time to keep memory low
+    """
+    from django.db.models import Max
+
+    from scoring.models import Frame, Game, Player, Roll
+
+    game = Game.objects.create(is_ongoing=False)
+
+    for start in range(0, player_count, chunk_size):
+        last_id = Player.objects.aggregate(last_id=Max('id'))['last_id']
+        Player.objects.bulk_create(
+            [
+                Player(game=game, name='player_{}'.format(index))
+                for index in range(
+                    start, min(start + chunk_size, player_count)
+                )
+            ]
+        )
+        players = game.players.filter(id__gt=last_id or 0)
+        Frame.objects.bulk_create(
+            [
+                Frame(
+                    player_id=player_id,
+                    frame_number=frame_number,
+                    frame_type=Frame.OPEN,
+                    rolls_made=2,
+                    pins_knocked_down=7
+                )
+                for player_id in players.values_list('id', flat=True)
+                for frame_number in range(1, 11)
+            ]
+        )
+        Roll.objects.bulk_create(
+            [
+                Roll(
+                    frame_id=frame_id,
+                    roll_number=roll_number,
+                    pins_knocked_down=roll_number + 2
+                )
+                for frame_id in Frame.objects.filter(
+                    player__in=players
+                ).values_list('id', flat=True)
+                for roll_number in (1, 2)
+            ]
+        )
+
+    return game
+
+
+def best_of(func, number, repeat=5):
+    """
+    Return the best time per call of func in seconds
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def percentile(values, fraction):
+    """
+    Return the value at fraction (0-1) of the sorted values
+    """
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,256 @@
+"""
+Admission control of API requests
+
+Each view belongs to an admission class with a priority, a concurrency
+limit and a bounded queue. Requests over the limits wait in priority
+order, so that rolls go before listings, and are rejected with a 503 and
+Retry-After when their queue is full or they waited too long.
+"""
+import threading
+import time
+from itertools import count
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class ServiceUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Service temporarily overloaded, try again later.'
+    default_code = 'service_unavailable'
+
+    def __init__(self, detail=None, code=None, wait=None):
+        super().__init__(detail, code)
+        self.wait = wait
+
+
+class AdmissionClass:
+    def __init__(self, name, priority, max_concurrent, max_queue):
+        self.name = name
+        self.priority = priority
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def get_stats(self):
+        return {
+            'priority': self.priority,
+            'max_concurrent': self.max_concurrent,
+            'max_queue': self.max_queue,
+            'in_flight': self.in_flight,
+            'queued': self.queued,
+            'admitted': self.admitted,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out
+        }
+
+
+class AdmissionController:
+    def __init__(self, max_concurrent, classes, queue_timeout):
+        """
+        classes maps names to dicts of PRIORITY, lower first,
+        MAX_CONCURRENT and MAX_QUEUE
+        """
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        self.classes = {
+            name: AdmissionClass(
+                name,
+                options['PRIORITY'],
+                options['MAX_CONCURRENT'],
+                options['MAX_QUEUE']
+            )
+            for name, options in classes.items()
+        }
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._waiters = []
+        self._counter = count()
+
+    def _can_admit(self, admission_class):
+        return (
+            self.in_flight < self.max_concurrent and
+            admission_class.in_flight < admission_class.max_concurrent
+        )
+
+    def _next_waiter(self):
+        """
+        Get the first waiter, in priority then arrival order, that could
+        be admitted now
+        Return None if there is none
+        """
+        for waiter in self._waiters:
+            if self._can_admit(waiter[2]):
+                return waiter
+
+        return None
+
+    def _admit(self, admission_class):
+        self.in_flight += 1
+        admission_class.in_flight += 1
+        admission_class.admitted += 1
+
+    def acquire(self, name):
+        """
+        Wait for a slot of the admission class name
+        Return False if the queue is full or the wait times out
+        """
+        admission_class = self.classes[name]
+
+        with self._condition:
+            next_waiter = self._next_waiter()
+
+            if self._can_admit(admission_class) and (
+                next_waiter is None or
+                next_waiter[2].priority > admission_class.priority
+            ):
+                self._admit(admission_class)
+                return True
+
+            if admission_class.queued >= admission_class.max_queue:
+                admission_class.rejected += 1
+                return False
+
+            waiter = (
+                admission_class.priority, next(self._counter), admission_class
+            )
+            self._waiters.append(waiter)
+            self._waiters.sort(key=lambda waiter: waiter[:2])
+            admission_class.queued += 1
+            deadline = time.monotonic() + self.queue_timeout
+
+            try:
+                while True:
+                    if self._next_waiter() is waiter:
+                        self._admit(admission_class)
+                        return True
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        admission_class.timed_out += 1
+                        return False
+
+                    self._condition.wait(remaining)
+            finally:
+                self._waiters.remove(waiter)
+                admission_class.queued -= 1
+                self._condition.notify_all()
+
+    def release(self, name):
+        admission_class = self.classes[name]
+
+        with self._condition:
+            self.in_flight -= 1
+            admission_class.in_flight -= 1
+            self._condition.notify_all()
+
+    def get_stats(self):
+        with self._condition:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'in_flight': self.in_flight,
+                'classes': {
+                    name: admission_class.get_stats()
+                    for name, admission_class in self.classes.items()
+                }
+            }
+
+
+_admission_controller = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller():
+    """
+    Get the AdmissionController of this process configured by
+    ADMISSION_CONTROL
+    Return None if admission control is disabled
+    """
+    global _admission_controller
+
+    if not settings.ADMISSION_CONTROL['ENABLED']:
+        return None
+
+    with _admission_controller_lock:
+        if _admission_controller is None:
+            _admission_controller = AdmissionController(
+                settings.ADMISSION_CONTROL['MAX_CONCURRENT'],
+                settings.ADMISSION_CONTROL['CLASSES'],
+                settings.ADMISSION_CONTROL['QUEUE_TIMEOUT']
+            )
+
+    return _admission_controller
+
+
+def reset_admission_controller(*args, **kwargs):
+    global _admission_controller
+
+    if kwargs.get('setting', 'ADMISSION_CONTROL') == 'ADMISSION_CONTROL':
+        with _admission_controller_lock:
+            _admission_controller = None
+
+
+setting_changed.connect(reset_admission_controller)
+
+
+class AdmissionControlMixin:
+    """
+    Admit requests to an APIView through the AdmissionController
+    """
+    admission_class = None
+
+    def get_admission_class(self):
+        return self.admission_class
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        controller = get_admission_controller()
+        name = self.get_admission_class()
+
+        if controller is None or name is None:
+            return
+
+        if not controller.acquire(name):
+            raise ServiceUnavailable(
+                wait=settings.ADMISSION_CONTROL['RETRY_AFTER']
+            )
+
+        self.admitted = (controller, name)
+
+    def release_on_close(self, response, controller, name):
+        """
+        Hold the slot of a streaming response until the server closes it,
+        as its content is only produced while the body is iterated
+        """
+        close = response.close
+
+        def release_and_close():
+            try:
+                close()
+            finally:
+                controller.release(name)
+
+        response.close = release_and_close
+
+    def dispatch(self, request, *args, **kwargs):
+        self.admitted = None
+        response = None
+
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+            return response
+        finally:
+            if self.admitted is not None:
+                controller, name = self.admitted
+
+                if response is not None and response.streaming:
+                    self.release_on_close(response, controller, name)
+                else:
+                    controller.release(name)
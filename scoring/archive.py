@@ -0,0 +1,139 @@
+"""
+Archival of finished Games
+
+The Players, Frames and Rolls of an archived Game are moved out of their
+tables into a single compressed ArchivedGame row per Game.
+"""
+import json
+import zlib
+
+from django.db import connection, transaction
+
+from scoring.models import ArchivedGame, Frame, Player, Roll
+
+
+ARCHIVE_FRAME_FIELDS = ('id', 'frame_number', 'frame_type', 'version')
+ARCHIVE_ROLL_FIELDS = ('id', 'roll_number', 'pins_knocked_down', 'sequence')
+
+
+def pack_rows(player_rows, frame_rows, roll_rows):
+    """
+    Pack the rows of a Game into compressed nested arrays:
+    [[player_id, name, [[*ARCHIVE_FRAME_FIELDS, [[*ARCHIVE_ROLL_FIELDS]]]]]]
+    """
+    rolls_by_frame = {}
+    for row in roll_rows:
+        rolls_by_frame.setdefault(row['frame_id'], []).append(
+            [row[field] for field in ARCHIVE_ROLL_FIELDS]
+        )
+
+    frames_by_player = {}
+    for row in frame_rows:
+        frames_by_player.setdefault(row['player_id'], []).append(
+            [row[field] for field in ARCHIVE_FRAME_FIELDS] +
+            [rolls_by_frame.get(row['id'], [])]
+        )
+
+    players = [
+        [row['id'], row['name'], frames_by_player.get(row['id'], [])]
+        for row in player_rows
+    ]
+    return zlib.compress(
+        json.dumps(players, separators=(',', ':')).encode()
+    )
+
+
+def unpack_rows(game_id, data):
+    """
+    Unpack the compressed rows of a Game
+    Return lists of Player, Frame and Roll rows
+    """
+    player_rows, frame_rows, roll_rows = [], [], []
+    players = json.loads(zlib.decompress(data).decode())
+
+    for player_id, name, frames in players:
+        player_rows.append(
+            {'id': player_id, 'game_id': game_id, 'name': name}
+        )
+
+        for frame in frames:
+            frame_row = dict(zip(ARCHIVE_FRAME_FIELDS, frame))
+            frame_row['player_id'] = player_id
+            frame_rows.append(frame_row)
+
+            for roll in frame[-1]:
+                roll_row = dict(zip(ARCHIVE_ROLL_FIELDS, roll))
+                roll_row['frame_id'] = frame_row['id']
+                roll_rows.append(roll_row)
+
+    return player_rows, frame_rows, roll_rows
+
+
+def archive_games(game_ids):
+    """
+    Move the Players, Frames and Rolls of the Games with game_ids into
+    ArchivedGames in a single transaction
+    Return the number of archived Games
+    """
+    with transaction.atomic():
+        players = Player.objects.filter(game_id__in=game_ids)
+        frames = Frame.objects.filter(player__game_id__in=game_ids)
+        rolls = Roll.objects.filter(frame__player__game_id__in=game_ids)
+
+        player_rows = list(
+            players.order_by('id').values('id', 'game_id', 'name')
+        )
+        frame_rows = list(
+            frames.order_by('id').values('player_id', *ARCHIVE_FRAME_FIELDS)
+        )
+        roll_rows = list(
+            rolls.order_by('id').values('frame_id', *ARCHIVE_ROLL_FIELDS)
+        )
+
+        game_by_player = {row['id']: row['game_id'] for row in player_rows}
+        game_by_frame = {
+            row['id']: game_by_player[row['player_id']] for row in frame_rows
+        }
+        rows_by_game = {game_id: ([], [], []) for game_id in game_ids}
+
+        for row in player_rows:
+            rows_by_game[row['game_id']][0].append(row)
+        for row in frame_rows:
+            rows_by_game[game_by_player[row['player_id']]][1].append(row)
+        for row in roll_rows:
+            rows_by_game[game_by_frame[row['frame_id']]][2].append(row)
+
+        archived_games = [
+            ArchivedGame(game_id=game_id, data=pack_rows(*rows))
+            for game_id, rows in rows_by_game.items()
+        ]
+        ArchivedGame.objects.bulk_create(archived_games)
+        rolls.delete()
+        frames.delete()
+        players.delete()
+
+    return len(archived_games)
+
+
+def compact_tables():
+    """
+    Reclaim the space freed in the Player, Frame and Roll tables
+    On SQLite the whole database is rewritten under an exclusive lock
+    Return False if the database backend is not supported
+    """
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('VACUUM')
+        return True
+
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            for model in (Roll, Frame, Player):
+                cursor.execute(
+                    'VACUUM ANALYZE {}'.format(
+                        connection.ops.quote_name(model._meta.db_table)
+                    )
+                )
+        return True
+
+    return False
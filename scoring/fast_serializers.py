@@ -0,0 +1,343 @@
+"""
+Serialization of Games straight from values() rows
+
+Produces the same output as GameSerializer without DRF field objects and
+with a constant number of queries per call. Archived Games are read from
+their packed rows.
+"""
+from collections import defaultdict
+
+from scoring.models import ArchivedGame, Frame, Player, Roll
+
+
+GAME_FIELDS = ('id', 'is_ongoing', 'version')
+PLAYER_FIELDS = ('id', 'game_id', 'name')
+FRAME_FIELDS = ('id', 'player_id', 'frame_number', 'frame_type')
+ROLL_FIELDS = ('id', 'frame_id', 'roll_number', 'pins_knocked_down')
+DELTA_ROLL_FIELDS = ROLL_FIELDS + ('sequence',)
+
+
+def _first_pins(frame, count):
+    """
+    Return the pins of the first count Rolls of a serialized Frame
+    """
+    rolls = sorted(frame['rolls'], key=lambda roll: roll['roll_number'])
+    return [roll['pins_knocked_down'] for roll in rolls[:count]]
+
+
+def get_frame_score(frame, frames_by_number):
+    """
+    Get the score of a serialized Frame, mirroring Frame.get_score
+    Return None if Rolls are pending
+    """
+    frame_type = frame['frame_type']
+
+    if frame_type == Frame.ROLLING:
+        return None
+
+    elif frame_type == Frame.OPEN:
+        return sum(roll['pins_knocked_down'] for roll in frame['rolls'])
+
+    next_frame_1 = frames_by_number.get(frame['frame_number'] + 1)
+
+    if next_frame_1 is None:
+        return None
+
+    elif frame_type == Frame.SPARE:
+        pins = _first_pins(next_frame_1, 1)
+        return 10 + pins[0] if pins else None
+
+    elif frame_type == Frame.STRIKE:
+        if next_frame_1['frame_type'] == Frame.ROLLING:
+            return None
+
+        elif next_frame_1['frame_type'] in (Frame.OPEN, Frame.SPARE):
+            return 10 + sum(_first_pins(next_frame_1, 2))
+
+        next_frame_2 = frames_by_number.get(frame['frame_number'] + 2)
+
+        if next_frame_2 is None:
+            return None
+
+        pins = _first_pins(next_frame_2, 1)
+        return 20 + pins[0] if pins else None
+
+
+def get_player_score(frames):
+    """
+    Get the sum of all serialized Frame scores for Player score
+    """
+    frames_by_number = {frame['frame_number']: frame for frame in frames}
+    frame_scores = [
+        get_frame_score(frame, frames_by_number) for frame in frames
+    ]
+    return sum(
+        [
+            frame_score
+            for frame_score in frame_scores
+            if frame_score is not None
+        ]
+    )
+
+
+def build_players(player_rows, frame_rows, roll_rows):
+    """
+    Build serialized Players from Player, Frame and Roll rows
+    Rows are dicts keyed by the *_FIELDS names, in output order
+    Return a dict of game_id to list of serialized Players
+    """
+    rolls_by_frame = defaultdict(list)
+    for row in roll_rows:
+        rolls_by_frame[row['frame_id']].append(
+            {
+                'id': row['id'],
+                'roll_number': row['roll_number'],
+                'pins_knocked_down': row['pins_knocked_down']
+            }
+        )
+
+    frames_by_player = defaultdict(list)
+    for row in frame_rows:
+        frames_by_player[row['player_id']].append(
+            {
+                'id': row['id'],
+                'frame_number': row['frame_number'],
+                'rolls': rolls_by_frame[row['id']],
+                'frame_type': row['frame_type']
+            }
+        )
+
+    players_by_game = defaultdict(list)
+    for row in player_rows:
+        frames = frames_by_player[row['id']]
+        players_by_game[row['game_id']].append(
+            {
+                'id': row['id'],
+                'name': row['name'],
+                'frames': frames,
+                'score': get_player_score(frames)
+            }
+        )
+
+    return players_by_game
+
+
+def build_games(game_rows, player_rows, frame_rows, roll_rows):
+    """
+    Build serialized Games from Game, Player, Frame and Roll rows
+    """
+    players_by_game = build_players(player_rows, frame_rows, roll_rows)
+
+    return [
+        {
+            'id': row['id'],
+            'is_ongoing': row['is_ongoing'],
+            'version': row['version'],
+            'players': players_by_game[row['id']]
+        }
+        for row in game_rows
+    ]
+
+
+def get_archived_rows(game):
+    """
+    Get the Player, Frame and Roll rows of an archived Game instance
+    Return None if the Game is not archived
+    """
+    if game.is_ongoing:
+        return None
+
+    data = ArchivedGame.objects.filter(
+        game=game
+    ).values_list('data', flat=True).first()
+
+    if data is None:
+        return None
+
+    from scoring.archive import unpack_rows
+
+    return unpack_rows(game.id, data)
+
+
+def serialize_games(queryset):
+    """
+    Serialize every Game in queryset with five queries
+    """
+    game_ids = queryset.values('id')
+    player_rows = list(
+        Player.objects.filter(
+            game__in=game_ids
+        ).order_by('id').values(*PLAYER_FIELDS)
+    )
+    frame_rows = list(
+        Frame.objects.filter(
+            player__game__in=game_ids
+        ).order_by('id').values(*FRAME_FIELDS)
+    )
+    roll_rows = list(
+        Roll.objects.filter(
+            frame__player__game__in=game_ids
+        ).order_by('id').values(*ROLL_FIELDS)
+    )
+
+    archives = ArchivedGame.objects.filter(
+        game__in=game_ids
+    ).values_list('game_id', 'data')
+    for game_id, data in archives:
+        from scoring.archive import unpack_rows
+
+        archived_rows = unpack_rows(game_id, data)
+        player_rows.extend(archived_rows[0])
+        frame_rows.extend(archived_rows[1])
+        roll_rows.extend(archived_rows[2])
+
+    return build_games(
+        queryset.values(*GAME_FIELDS), player_rows, frame_rows, roll_rows
+    )
+
+
+def serialize_game(game):
+    """
+    Serialize a single Game instance with three queries, or one if it
+    is archived
+    """
+    game_row = {field: getattr(game, field) for field in GAME_FIELDS}
+    archived_rows = get_archived_rows(game)
+
+    if archived_rows is not None:
+        return build_games([game_row], *archived_rows)[0]
+
+    return build_games(
+        [game_row],
+        Player.objects.filter(
+            game=game
+        ).order_by('id').values(*PLAYER_FIELDS),
+        Frame.objects.filter(
+            player__game=game
+        ).order_by('id').values(*FRAME_FIELDS),
+        Roll.objects.filter(
+            frame__player__game=game
+        ).order_by('id').values(*ROLL_FIELDS)
+    )[0]
+
+
+def summarize_game(data):
+    """
+    Project a serialized Game onto its Player scores, dropping Frames
+    """
+    return {
+        'id': data['id'],
+        'is_ongoing': data['is_ongoing'],
+        'version': data['version'],
+        'players': [
+            {
+                'id': player['id'],
+                'name': player['name'],
+                'score': player['score']
+            }
+            for player in data['players']
+        ]
+    }
+
+
+def _archived_game_delta(game, since, archived_rows):
+    """
+    Get the changed Rolls, Frames and Players of an archived Game
+    """
+    player_rows, frame_rows, roll_rows = archived_rows
+    player_by_frame = {row['id']: row['player_id'] for row in frame_rows}
+
+    changed_rolls = [
+        {field: row[field] for field in DELTA_ROLL_FIELDS}
+        for row in sorted(roll_rows, key=lambda row: row['sequence'])
+        if row['sequence'] > since
+    ]
+    changed_frames = [
+        {'id': row['id'], 'frame_type': row['frame_type']}
+        for row in frame_rows
+        if row['version'] > since
+    ]
+    player_ids = set(
+        player_by_frame[row['frame_id']] for row in changed_rolls
+    )
+    players = [
+        player
+        for player in build_players(*archived_rows)[game.id]
+        if player['id'] in player_ids
+    ]
+
+    return changed_rolls, changed_frames, players
+
+
+def _game_delta(game, since, version):
+    """
+    Get the changed Rolls, Frames and Players of a Game up to version
+    Rolls made after version are left out and Frames they completed are
+    still ROLLING
+    """
+    rolls = Roll.objects.filter(
+        frame__player__game=game, sequence__gt=since, sequence__lte=version
+    )
+    frames = Frame.objects.filter(
+        player__game=game, version__gt=since, version__lte=version
+    )
+    player_ids = rolls.values('frame__player_id')
+
+    frame_rows = [
+        dict(
+            row,
+            frame_type=(
+                row['frame_type'] if row['version'] <= version
+                else Frame.ROLLING
+            )
+        )
+        for row in Frame.objects.filter(
+            player__in=player_ids
+        ).order_by('id').values(*FRAME_FIELDS + ('version',))
+    ]
+    players_by_game = build_players(
+        Player.objects.filter(
+            id__in=player_ids
+        ).order_by('id').values(*PLAYER_FIELDS),
+        frame_rows,
+        Roll.objects.filter(
+            frame__player__in=player_ids, sequence__lte=version
+        ).order_by('id').values(*ROLL_FIELDS)
+    )
+
+    return (
+        list(rolls.order_by('sequence').values(*DELTA_ROLL_FIELDS)),
+        list(frames.order_by('id').values('id', 'frame_type')),
+        players_by_game[game.id]
+    )
+
+
+def serialize_game_delta(game, since):
+    """
+    Serialize the changes made to a Game instance after version since:
+    the Rolls added, the Frames whose frame_type changed and the scores
+    of the Players that rolled
+    Changes are read up to the version of the instance, so that Rolls
+    committed meanwhile are left for the next delta
+    """
+    archived_rows = get_archived_rows(game)
+
+    if archived_rows is not None:
+        rolls, frames, players = _archived_game_delta(
+            game, since, archived_rows
+        )
+    else:
+        rolls, frames, players = _game_delta(game, since, game.version)
+
+    return {
+        'id': game.id,
+        'is_ongoing': game.is_ongoing,
+        'version': game.version,
+        'since': since,
+        'rolls': rolls,
+        'frames': frames,
+        'players': [
+            {'id': player['id'], 'score': player['score']}
+            for player in players
+        ]
+    }
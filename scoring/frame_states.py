@@ -0,0 +1,134 @@
+"""
+Transition table of the Frame state machine
+
+The state of a Frame is its frame number, the Rolls made and the pins
+knocked down so far. TRANSITIONS maps every state of a ROLLING Frame to
+a dict of the possible pins of the next Roll to the next
+(frame_type, rolls_made, pins_knocked_down). Pins missing from the dict
+cannot be knocked down and states missing from the table are complete.
+
+The pins knocked down rather than the pins standing are part of the
+state because in the tenth frame a strike and a gutter ball both leave
+ten pins standing but only the strike earns a third Roll.
+"""
+STRIKE = 'STRIKE'
+SPARE = 'SPARE'
+OPEN = 'OPEN'
+ROLLING = 'ROLLING'
+
+
+class InvalidRoll(ValueError):
+    pass
+
+
+def _roll(frame_number, rolls_made, pins_knocked_down, pins_standing, pins):
+    """
+    Apply the rules of bowling to a Roll of pins
+    Return the next (frame_type, rolls_made, pins_knocked_down,
+    pins_standing)
+    """
+    rolls_made += 1
+    pins_knocked_down += pins
+    pins_standing -= pins
+
+    if frame_number < 10:
+        if pins_standing == 0:
+            frame_type = STRIKE if rolls_made == 1 else SPARE
+        elif rolls_made == 2:
+            frame_type = OPEN
+        else:
+            frame_type = ROLLING
+
+        return frame_type, rolls_made, pins_knocked_down, pins_standing
+
+    if rolls_made == 3 or (rolls_made == 2 and pins_knocked_down < 10):
+        return OPEN, rolls_made, pins_knocked_down, pins_standing
+
+    if pins_standing == 0:
+        pins_standing = 10
+
+    return ROLLING, rolls_made, pins_knocked_down, pins_standing
+
+
+def _build_transitions():
+    transitions = {}
+
+    for frame_number in range(1, 11):
+        pending = [(0, 0, 10)]
+
+        while pending:
+            rolls_made, pins_knocked_down, pins_standing = pending.pop()
+            key = (frame_number, rolls_made, pins_knocked_down)
+
+            if key in transitions:
+                continue
+
+            transitions[key] = {}
+
+            for pins in range(pins_standing + 1):
+                frame_type, *state = _roll(
+                    frame_number, rolls_made, pins_knocked_down,
+                    pins_standing, pins
+                )
+                transitions[key][pins] = (frame_type, state[0], state[1])
+
+                if frame_type == ROLLING:
+                    pending.append(state)
+
+    return transitions
+
+
+TRANSITIONS = _build_transitions()
+
+
+def next_state(frame_number, rolls_made, pins_knocked_down, pins):
+    """
+    Get the (frame_type, rolls_made, pins_knocked_down) of a Frame after
+    a Roll of pins
+    Return None if the Frame is complete and raise InvalidRoll if the
+    pins cannot be knocked down
+    """
+    transitions = TRANSITIONS.get(
+        (frame_number, rolls_made, pins_knocked_down)
+    )
+
+    if transitions is None:
+        return None
+
+    try:
+        return transitions[pins]
+    except KeyError:
+        raise InvalidRoll(
+            'Cannot knock down {} pins with {} pins standing'.format(
+                pins, len(transitions) - 1
+            )
+        )
+
+
+def validate_rolls(rolls):
+    """
+    Validate the pins knocked down by the Rolls of a Player in order
+    Return the frame_type of each of the ten Frames and raise InvalidRoll
+    if a Roll is not possible
+    """
+    frame_types = []
+    rolls_made = pins_knocked_down = 0
+
+    for index, pins in enumerate(rolls, start=1):
+        if len(frame_types) == 10:
+            raise InvalidRoll(
+                'Roll {} comes after the last frame'.format(index)
+            )
+
+        try:
+            frame_type, rolls_made, pins_knocked_down = next_state(
+                len(frame_types) + 1, rolls_made, pins_knocked_down, pins
+            )
+        except InvalidRoll as exc:
+            raise InvalidRoll('Roll {}: {}'.format(index, exc))
+
+        if frame_type != ROLLING:
+            frame_types.append(frame_type)
+            rolls_made = pins_knocked_down = 0
+
+    return frame_types + [ROLLING] * (10 - len(frame_types))
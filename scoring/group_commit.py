@@ -0,0 +1,147 @@
+"""
+Group commit of Rolls
+
+Roll requests are queued in process and applied by a single writer
+thread, many to a transaction, so that concurrent requests share one
+commit. Requests are applied in the order they were submitted and each
+waits on a Future for its own Roll or error.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from scoring.rolls import apply_roll
+
+
+_STOP = object()
+
+
+class RollWriter:
+    def __init__(self, interval=0.002, max_batch_size=256):
+        self.interval = interval
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='roll-writer', daemon=True
+                )
+                self._thread.start()
+
+    def stop(self):
+        """
+        Apply the Rolls already submitted and stop the writer thread
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def submit(self, game_id, player_id, pins_knocked_down):
+        """
+        Queue a Roll and return a Future for the result of apply_roll
+        """
+        self.start()
+        future = Future()
+        self._queue.put(
+            (future, (game_id, player_id, pins_knocked_down))
+        )
+        return future
+
+    def _next_batch(self):
+        """
+        Block for the next request then collect the ones that arrive
+        within interval of it, up to max_batch_size
+        Return the batch and whether the writer should stop
+        """
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.interval
+        while len(batch) < self.max_batch_size:
+            try:
+                item = self._queue.get(
+                    timeout=max(0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                break
+
+            if item is _STOP:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self):
+        try:
+            stop = False
+            while not stop:
+                batch, stop = self._next_batch()
+                if batch:
+                    self._apply(batch)
+        finally:
+            connection.close()
+
+    def _apply(self, batch):
+        """
+        Apply a batch of requests in one transaction, each in a savepoint
+        so that a failed request does not roll back the others
+        Futures are resolved once the transaction has committed
+        """
+        results = []
+
+        try:
+            with transaction.atomic():
+                for future, args in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+
+                    try:
+                        with transaction.atomic():
+                            results.append((future, apply_roll(*args), None))
+                    except Exception as exc:
+                        results.append((future, None, exc))
+        except Exception as exc:
+            for future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for future, roll, exc in results:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(roll)
+
+
+_roll_writer = None
+_roll_writer_lock = threading.Lock()
+
+
+def get_roll_writer():
+    """
+    Get the RollWriter of this process configured by ROLL_GROUP_COMMIT
+    """
+    global _roll_writer
+
+    with _roll_writer_lock:
+        if _roll_writer is None:
+            _roll_writer = RollWriter(
+                interval=settings.ROLL_GROUP_COMMIT['INTERVAL'],
+                max_batch_size=settings.ROLL_GROUP_COMMIT['MAX_BATCH_SIZE']
+            )
+
+    return _roll_writer
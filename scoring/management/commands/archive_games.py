@@ -0,0 +1,89 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from scoring.archive import archive_games, compact_tables
+from scoring.models import Game
+
+
+class Command(BaseCommand):
+    help = (
+        'Move the Players, Frames and Rolls of Games finished before a '
+        'cutoff into packed archives, in batches of one transaction each'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=30,
+            help='Archive Games finished more than this many days ago'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=100,
+            help='Number of Games archived per transaction'
+        )
+        parser.add_argument(
+            '--max-batches', type=int, default=None,
+            help='Stop after this many batches'
+        )
+        parser.add_argument(
+            '--pause', type=float, default=0,
+            help='Seconds to sleep between batches to let writers through'
+        )
+        parser.add_argument(
+            '--compact', action='store_true',
+            help=(
+                'Vacuum the tables once Games are archived. On SQLite this '
+                'rewrites the whole database file under an exclusive lock '
+                'that blocks every reader and writer until it is done, so '
+                'only use it in a maintenance window. On PostgreSQL the '
+                'tables stay readable and writable'
+            )
+        )
+
+    def get_queryset(self, days):
+        """
+        Games finished before the cutoff that are not yet archived
+        Games finished before finished_at was recorded are included
+        """
+        cutoff = timezone.now() - timedelta(days=days)
+
+        return Game.objects.filter(
+            Q(finished_at__lt=cutoff) | Q(finished_at__isnull=True),
+            is_ongoing=False,
+            archive__isnull=True
+        ).order_by('id')
+
+    def handle(self, *args, **options):
+        queryset = self.get_queryset(options['days'])
+        batches = 0
+        archived = 0
+
+        while (
+            options['max_batches'] is None or
+            batches < options['max_batches']
+        ):
+            game_ids = list(
+                queryset.values_list('id', flat=True)[:options['batch_size']]
+            )
+
+            if not game_ids:
+                break
+
+            if batches and options['pause']:
+                time.sleep(options['pause'])
+
+            archived += archive_games(game_ids)
+            batches += 1
+
+        self.stdout.write(
+            'Archived {} games in {} batches'.format(archived, batches)
+        )
+
+        if archived and options['compact']:
+            if compact_tables():
+                self.stdout.write('Compacted tables')
+            else:
+                self.stdout.write('Compacting is not supported by database')
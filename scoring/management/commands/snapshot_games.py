@@ -0,0 +1,69 @@
+import zlib
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from scoring.models import Game
+from scoring.serializers import GameSerializer
+from scoring.snapshots import create_snapshot, render_game
+
+
+class Command(BaseCommand):
+    help = (
+        'Store snapshots of finished Games that have none, or check that '
+        'stored snapshots match the live serializer output'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Compare stored snapshots with the live serializer output'
+        )
+
+    def backfill(self):
+        games = Game.objects.filter(
+            is_ongoing=False, snapshot__isnull=True
+        ).order_by('id')
+        count = 0
+
+        for game in games.iterator():
+            create_snapshot(game)
+            count += 1
+
+        self.stdout.write('Stored {} snapshots'.format(count))
+
+    def render_live(self, game):
+        """
+        Render a Game with GameSerializer, or from its archived rows
+        """
+        if hasattr(game, 'archive'):
+            return render_game(game)
+
+        return JSONRenderer().render(GameSerializer(game).data)
+
+    def check_snapshots(self):
+        games = Game.objects.filter(
+            snapshot__isnull=False
+        ).select_related('snapshot', 'archive').order_by('id')
+        mismatched = []
+        count = 0
+
+        for game in games.iterator():
+            if zlib.decompress(game.snapshot.data) != self.render_live(game):
+                mismatched.append(game.id)
+            count += 1
+
+        if mismatched:
+            raise CommandError(
+                'Snapshots of games {} do not match'.format(
+                    ', '.join(map(str, mismatched))
+                )
+            )
+
+        self.stdout.write('Checked {} snapshots'.format(count))
+
+    def handle(self, *args, **options):
+        if options['check']:
+            self.check_snapshots()
+        else:
+            self.backfill()
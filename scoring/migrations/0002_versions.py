@@ -0,0 +1,54 @@
+# Generated by Django 2.0.6 on 2026-10-19 13:04
+
+from django.db import migrations, models
+
+
+def number_rolls(apps, schema_editor):
+    """
+    Number existing Rolls per Game in creation order and version their
+    Frames and Games accordingly
+    """
+    Game = apps.get_model('scoring', 'Game')
+    Frame = apps.get_model('scoring', 'Frame')
+    Roll = apps.get_model('scoring', 'Roll')
+
+    for game in Game.objects.all():
+        rolls = Roll.objects.filter(
+            frame__player__game=game
+        ).select_related('frame').order_by('id')
+
+        for sequence, roll in enumerate(rolls, start=1):
+            roll.sequence = sequence
+            roll.save(update_fields=['sequence'])
+
+            if roll.frame.frame_type != 'ROLLING':
+                Frame.objects.filter(id=roll.frame_id).update(version=sequence)
+
+        game.version = rolls.count()
+        game.save(update_fields=['version'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='frame',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='roll',
+            name='sequence',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(number_rolls, migrations.RunPython.noop),
+    ]
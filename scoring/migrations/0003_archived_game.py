@@ -0,0 +1,26 @@
+# Generated by Django 2.0.6 on 2026-10-19 13:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0002_versions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedGame',
+            fields=[
+                ('game', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='archive', serialize=False, to='scoring.Game')),
+                ('data', models.BinaryField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='finished_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
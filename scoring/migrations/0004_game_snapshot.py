@@ -0,0 +1,21 @@
+# Generated by Django 2.0.6 on 2026-10-19 13:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0003_archived_game'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameSnapshot',
+            fields=[
+                ('game', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='scoring.Game')),
+                ('data', models.BinaryField()),
+            ],
+        ),
+    ]
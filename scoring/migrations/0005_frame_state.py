@@ -0,0 +1,40 @@
+# Generated by Django 2.0.6 on 2026-10-19 13:24
+
+from django.db import migrations, models
+
+
+def count_rolls(apps, schema_editor):
+    """
+    Store the Rolls made and pins knocked down of existing Frames
+    """
+    Frame = apps.get_model('scoring', 'Frame')
+    frames = Frame.objects.annotate(
+        roll_count=models.Count('rolls'),
+        pins_total=models.Sum('rolls__pins_knocked_down')
+    ).filter(roll_count__gt=0)
+
+    for frame in frames.iterator():
+        Frame.objects.filter(id=frame.id).update(
+            rolls_made=frame.roll_count,
+            pins_knocked_down=frame.pins_total
+        )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scoring', '0004_game_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='frame',
+            name='pins_knocked_down',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='frame',
+            name='rolls_made',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_rolls, migrations.RunPython.noop),
+    ]
@@ -1,17 +1,34 @@
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
+
+from scoring import frame_states
 
 
 class Game(models.Model):
     is_ongoing = models.BooleanField(default=True)
+    version = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
 
     def update_is_ongoing(self):
+        """
+        Mark the Game as finished once none of its Frames are rolling
+        A finished Game is left as is
+        """
+        if not self.is_ongoing:
+            return
+
         is_ongoing = Frame.objects.filter(
             player__game=self, frame_type=Frame.ROLLING
         ).exists()
 
         if not is_ongoing:
+            from scoring.snapshots import create_snapshot
+
             self.is_ongoing = False
-            self.save()
+            self.finished_at = timezone.now()
+            self.save(update_fields=['is_ongoing', 'finished_at'])
+            self.refresh_from_db(fields=['version'])
+            create_snapshot(self)
 
 
 class Player(models.Model):
@@ -36,10 +53,10 @@ class Player(models.Model):
 
 
 class Frame(models.Model):
-    STRIKE = 'STRIKE'
-    SPARE = 'SPARE'
-    OPEN = 'OPEN'
-    ROLLING = 'ROLLING'
+    STRIKE = frame_states.STRIKE
+    SPARE = frame_states.SPARE
+    OPEN = frame_states.OPEN
+    ROLLING = frame_states.ROLLING
     FRAME_TYPE_CHOICES = (
         (STRIKE, STRIKE),
         (SPARE, SPARE),
@@ -53,6 +70,17 @@ class Frame(models.Model):
     frame_type = models.CharField(
         max_length=7, choices=FRAME_TYPE_CHOICES, default=ROLLING
     )
+    version = models.PositiveIntegerField(default=0)
+    rolls_made = models.PositiveIntegerField(default=0)
+    pins_knocked_down = models.PositiveIntegerField(default=0)
+
+    def _next_version(self):
+        """
+        Increment the version of the Game the Frame belongs to and return it
+        """
+        games = Game.objects.filter(players=self.player_id)
+        games.update(version=models.F('version') + 1)
+        return games.values_list('version', flat=True).get()
 
     def _calculate_open_score(self):
         """
@@ -134,45 +162,37 @@ class Frame(models.Model):
     def make_roll(self, pins_knocked_down):
         """
         Make a new Roll on the Frame and return it
-        Update the frame_type of the Frame
-        Return None if Frame is complete
-        """
-        last_roll = self.rolls.order_by('roll_number').last()
-
-        if last_roll is None:
-            if pins_knocked_down == 10:
-                if self.frame_number < 10:
-                    self.frame_type = Frame.STRIKE
-
-        elif last_roll.roll_number == 1:
-            frame_total = last_roll.pins_knocked_down + pins_knocked_down
-
-            if frame_total == 10:
-                if self.frame_number < 10:
-                    self.frame_type = Frame.SPARE
-
-            elif frame_total < 10:
-                self.frame_type = Frame.OPEN
-
-        elif last_roll.roll_number == 2:
-            if (
-                self.frame_number < 10 or
-                (self.frame_number == 10 and self.frame_type != Frame.ROLLING)
-            ):
-                return None
-
-            elif self.frame_number == 10:
-                self.frame_type = Frame.OPEN
-
-        self.save()
-        return Roll.objects.create(
-            frame=self,
-            pins_knocked_down=pins_knocked_down,
-            roll_number=(
-                last_roll.roll_number + 1 if last_roll is not None else 1
-            )
+        Update the state of the Frame and the version of the Game
+        Return None if Frame is complete and raise InvalidRoll if the pins
+        cannot be knocked down
+        """
+        state = frame_states.next_state(
+            self.frame_number,
+            self.rolls_made,
+            self.pins_knocked_down,
+            pins_knocked_down
         )
 
+        if state is None:
+            return None
+
+        frame_type = self.frame_type
+        self.frame_type, self.rolls_made, self.pins_knocked_down = state
+
+        with transaction.atomic():
+            version = self._next_version()
+
+            if self.frame_type != frame_type:
+                self.version = version
+
+            self.save()
+            return Roll.objects.create(
+                frame=self,
+                pins_knocked_down=pins_knocked_down,
+                roll_number=self.rolls_made,
+                sequence=version
+            )
+
 
 class Roll(models.Model):
     frame = models.ForeignKey(
@@ -180,3 +200,20 @@ class Roll(models.Model):
     )
     pins_knocked_down = models.IntegerField()
     roll_number = models.IntegerField()
+    sequence = models.PositiveIntegerField(default=0)
+
+
+class ArchivedGame(models.Model):
+    game = models.OneToOneField(
+        Game, on_delete=models.CASCADE, primary_key=True,
+        related_name='archive'
+    )
+    data = models.BinaryField()
+
+
+class GameSnapshot(models.Model):
+    game = models.OneToOneField(
+        Game, on_delete=models.CASCADE, primary_key=True,
+        related_name='snapshot'
+    )
+    data = models.BinaryField()
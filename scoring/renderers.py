@@ -0,0 +1,101 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from scoring.models import Frame
+
+
+FRAME_TYPE_CODES = {
+    Frame.STRIKE: 'X',
+    Frame.SPARE: '/',
+    Frame.OPEN: 'O',
+    Frame.ROLLING: '.'
+}
+
+
+def pack_player(player):
+    """
+    Pack a serialized Player into [id, name, pins, frame_types, score]
+    pins holds every Roll in order and frame_types one code per Frame
+    A Player of a Game summary, without Frames, is packed into
+    [id, name, score] and one of a Game delta into [id, score]
+    """
+    if 'frames' not in player:
+        if 'name' not in player:
+            return [player['id'], player['score']]
+
+        return [player['id'], player['name'], player['score']]
+
+    frames = sorted(player['frames'], key=lambda frame: frame['frame_number'])
+    pins = [
+        roll['pins_knocked_down']
+        for frame in frames
+        for roll in sorted(
+            frame['rolls'], key=lambda roll: roll['roll_number']
+        )
+    ]
+    frame_types = ''.join(
+        [FRAME_TYPE_CODES[frame['frame_type']] for frame in frames]
+    )
+
+    return [player['id'], player['name'], pins, frame_types, player['score']]
+
+
+def pack_data(data):
+    """
+    Pack serialized Games into their dense representation
+    Anything that is not a Game (Rolls, errors) is returned unchanged
+    """
+    if isinstance(data, list):
+        return [pack_data(item) for item in data]
+
+    if isinstance(data, dict) and 'players' in data:
+        packed = dict(data)
+        packed['players'] = [
+            pack_player(player) for player in data['players']
+        ]
+        return packed
+
+    return data
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Render the full response tree as MessagePack
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        import msgpack
+
+        return msgpack.packb(data, use_bin_type=True)
+
+
+class PackedJSONRenderer(JSONRenderer):
+    """
+    Render Games in their dense packed representation as JSON
+    """
+    media_type = 'application/vnd.bowling.packed+json'
+    format = 'packed'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(
+            pack_data(data), accepted_media_type, renderer_context
+        )
+
+
+class PackedMessagePackRenderer(MessagePackRenderer):
+    """
+    Render Games in their dense packed representation as MessagePack
+    """
+    media_type = 'application/vnd.bowling.packed+msgpack'
+    format = 'packed-msgpack'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(
+            pack_data(data), accepted_media_type, renderer_context
+        )
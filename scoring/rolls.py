@@ -0,0 +1,35 @@
+from rest_framework.exceptions import NotFound, ParseError
+
+from scoring.frame_states import InvalidRoll
+from scoring.models import Game, Player
+
+
+def apply_roll(game_id, player_id, pins_knocked_down):
+    """
+    Make a Roll for the Player of the Game and return it
+    Raise NotFound if either does not exist and ParseError if the Player
+    has exhausted all their rolls or the pins cannot be knocked down
+    """
+    try:
+        game = Game.objects.get(id=game_id)
+    except Game.DoesNotExist:
+        raise NotFound('Game with id {} not found'.format(game_id))
+
+    try:
+        player = game.players.get(id=player_id)
+    except Player.DoesNotExist:
+        raise NotFound('Player with id {} not found.'.format(player_id))
+
+    try:
+        roll = player.make_roll(pins_knocked_down)
+    except InvalidRoll as exc:
+        raise ParseError(str(exc))
+
+    game.update_is_ongoing()
+
+    if roll is None:
+        raise ParseError(
+            '{} has exhausted all their rolls'.format(player.name)
+        )
+
+    return roll
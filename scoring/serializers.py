@@ -79,4 +79,4 @@ class GameSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Game
-        fields = ('id', 'is_ongoing', 'players')
+        fields = ('id', 'is_ongoing', 'version', 'players')
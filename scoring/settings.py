@@ -106,10 +106,45 @@ AUTH_PASSWORD_VALIDATORS = [
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
         'rest_framework.renderers.JSONRenderer',
+        'scoring.renderers.MessagePackRenderer',
+        'scoring.renderers.PackedJSONRenderer',
+        'scoring.renderers.PackedMessagePackRenderer',
     )
 }
 
 
+# Number of players rendered per chunk by GET /games/<id>/?stream=true
+
+STREAMING_CHUNK_SIZE = 500
+
+
+# Group commit of rolls, see scoring/group_commit.py
+
+ROLL_GROUP_COMMIT = {
+    'ENABLED': False,
+    'INTERVAL': 0.002,
+    'MAX_BATCH_SIZE': 256,
+    'TIMEOUT': 5,
+    'RETRY_AFTER': 1
+}
+
+
+# Admission control of requests, see scoring/admission.py
+# Classes with a lower PRIORITY are admitted first
+
+ADMISSION_CONTROL = {
+    'ENABLED': True,
+    'MAX_CONCURRENT': 16,
+    'QUEUE_TIMEOUT': 1.0,
+    'RETRY_AFTER': 1,
+    'CLASSES': {
+        'roll': {'PRIORITY': 0, 'MAX_CONCURRENT': 16, 'MAX_QUEUE': 64},
+        'read': {'PRIORITY': 1, 'MAX_CONCURRENT': 8, 'MAX_QUEUE': 32},
+        'list': {'PRIORITY': 2, 'MAX_CONCURRENT': 1, 'MAX_QUEUE': 2}
+    }
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/2.0/topics/i18n/
 
@@ -0,0 +1,38 @@
+"""
+Django settings for API only scoring workers.
+
+Drops the admin, auth, sessions, messages and staticfiles apps and their
+middleware, none of which the scoring API uses. Select it with
+DJANGO_SETTINGS_MODULE=scoring.settings_api
+"""
+
+from scoring.settings import *  # noqa: F401,F403
+from scoring.settings import REST_FRAMEWORK
+
+
+INSTALLED_APPS = [
+    'scoring'
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'scoring.urls_api'
+
+TEMPLATES = []
+
+AUTH_PASSWORD_VALIDATORS = []
+
+
+# Without django.contrib.auth requests are not authenticated
+
+REST_FRAMEWORK = dict(
+    REST_FRAMEWORK,
+    DEFAULT_AUTHENTICATION_CLASSES=(),
+    DEFAULT_PERMISSION_CLASSES=(
+        'rest_framework.permissions.AllowAny',
+    ),
+    UNAUTHENTICATED_USER=None
+)
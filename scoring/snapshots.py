@@ -0,0 +1,57 @@
+"""
+Snapshots of finished Games
+
+A finished Game never changes, so its JSON is rendered once when it
+finishes and stored compressed. Reads serve the stored JSON as is.
+"""
+import zlib
+
+from rest_framework.renderers import JSONRenderer
+
+from scoring.fast_serializers import serialize_game
+from scoring.models import GameSnapshot
+
+
+def render_game(game):
+    """
+    Render the JSON of a Game instance as served by the API
+    """
+    return JSONRenderer().render(serialize_game(game))
+
+
+def create_snapshot(game):
+    """
+    Store the rendered JSON of a finished Game instance
+    """
+    return GameSnapshot.objects.update_or_create(
+        game=game, defaults={'data': zlib.compress(render_game(game))}
+    )[0]
+
+
+def get_snapshot(game):
+    """
+    Get the stored JSON of a Game instance
+    Return None if it has no snapshot
+    """
+    if game.is_ongoing:
+        return None
+
+    data = GameSnapshot.objects.filter(
+        game=game
+    ).values_list('data', flat=True).first()
+
+    if data is None:
+        return None
+
+    return zlib.decompress(data)
+
+
+def get_snapshots(queryset):
+    """
+    Get a dict of Game id to stored JSON for the Games in queryset
+    """
+    snapshots = GameSnapshot.objects.filter(
+        game__in=queryset.values('id')
+    ).values_list('game_id', 'data')
+
+    return {game_id: zlib.decompress(data) for game_id, data in snapshots}
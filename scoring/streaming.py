@@ -0,0 +1,85 @@
+"""
+Streaming serialization of Games with many Players
+
+Players are fetched and rendered in chunks so that memory stays bounded
+by the chunk size rather than by the number of Players. The concatenated
+chunks are byte identical to rendering serialize_game with JSONRenderer.
+"""
+from rest_framework.renderers import JSONRenderer
+
+from scoring.fast_serializers import (
+    FRAME_FIELDS,
+    PLAYER_FIELDS,
+    ROLL_FIELDS,
+    build_players,
+    get_archived_rows
+)
+from scoring.models import Frame, Player, Roll
+
+
+def iter_players(game, chunk_size):
+    """
+    Yield lists of up to chunk_size serialized Players of a Game instance
+    with three queries per chunk, plus one if the last chunk is full
+    """
+    archived_rows = get_archived_rows(game)
+
+    if archived_rows is not None:
+        players = build_players(*archived_rows)[game.id]
+        for start in range(0, len(players), chunk_size):
+            yield players[start:start + chunk_size]
+        return
+
+    last_id = 0
+    while True:
+        player_rows = list(
+            Player.objects.filter(
+                game=game, id__gt=last_id
+            ).order_by('id').values(*PLAYER_FIELDS)[:chunk_size]
+        )
+
+        if not player_rows:
+            return
+
+        id_range = (player_rows[0]['id'], player_rows[-1]['id'])
+        last_id = id_range[1]
+
+        yield build_players(
+            player_rows,
+            Frame.objects.filter(
+                player__game=game, player__id__range=id_range
+            ).order_by('id').values(*FRAME_FIELDS),
+            Roll.objects.filter(
+                frame__player__game=game,
+                frame__player__id__range=id_range
+            ).order_by('id').values(*ROLL_FIELDS)
+        )[game.id]
+
+        if len(player_rows) < chunk_size:
+            return
+
+
+def iter_game_json(game, chunk_size=500):
+    """
+    Yield the JSON of a Game instance in chunks of chunk_size Players
+    """
+    renderer = JSONRenderer()
+    head = renderer.render(
+        {
+            'id': game.id,
+            'is_ongoing': game.is_ongoing,
+            'version': game.version,
+            'players': []
+        }
+    )
+
+    yield head[:-len(b']}')]
+
+    separator = b''
+    for players in iter_players(game, chunk_size):
+        yield separator + b','.join(
+            [renderer.render(player) for player in players]
+        )
+        separator = b','
+
+    yield b']}'
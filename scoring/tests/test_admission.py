@@ -0,0 +1,164 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from scoring.admission import AdmissionController
+from scoring.tests.test_fast_serializers import create_game
+
+
+CLASSES = {
+    'roll': {'PRIORITY': 0, 'MAX_CONCURRENT': 2, 'MAX_QUEUE': 2},
+    'list': {'PRIORITY': 2, 'MAX_CONCURRENT': 1, 'MAX_QUEUE': 1}
+}
+
+
+class AdmissionControllerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.controller = AdmissionController(2, CLASSES, queue_timeout=5)
+
+    def acquire_in_thread(self, name, admitted):
+        def acquire():
+            admitted.append((name, self.controller.acquire(name)))
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        return thread
+
+    def wait_for_queued(self, name, queued):
+        for _ in range(500):
+            if self.controller.classes[name].queued == queued:
+                return
+            time.sleep(0.01)
+
+        self.fail('{} requests never queued'.format(queued))
+
+    def test_acquire_release(self):
+        """
+        Test requests are admitted up to the class limit
+        """
+        self.assertTrue(self.controller.acquire('list'))
+
+        self.controller.queue_timeout = 0
+        self.assertFalse(self.controller.acquire('list'))
+        self.assertTrue(self.controller.acquire('roll'))
+
+        self.controller.release('list')
+        self.controller.release('roll')
+
+        stats = self.controller.get_stats()
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(stats['classes']['list']['admitted'], 1)
+        self.assertEqual(stats['classes']['list']['timed_out'], 1)
+        self.assertEqual(stats['classes']['roll']['admitted'], 1)
+
+    def test_acquire_queue_full(self):
+        """
+        Test requests are rejected at once when their queue is full
+        """
+        admitted = []
+        self.controller.acquire('list')
+        thread = self.acquire_in_thread('list', admitted)
+        self.wait_for_queued('list', 1)
+
+        self.assertFalse(self.controller.acquire('list'))
+        self.assertEqual(self.controller.classes['list'].rejected, 1)
+
+        self.controller.release('list')
+        thread.join()
+        self.assertEqual(admitted, [('list', True)])
+
+    def test_acquire_priority(self):
+        """
+        Test queued rolls are admitted before queued listings
+        """
+        admitted = []
+        self.controller.acquire('roll')
+        self.controller.acquire('roll')
+
+        threads = [self.acquire_in_thread('list', admitted)]
+        self.wait_for_queued('list', 1)
+        threads.append(self.acquire_in_thread('roll', admitted))
+        self.wait_for_queued('roll', 1)
+
+        self.controller.release('roll')
+        threads[1].join()
+        self.assertEqual(admitted, [('roll', True)])
+
+        self.controller.release('roll')
+        threads[0].join()
+        self.assertEqual(admitted, [('roll', True), ('list', True)])
+
+
+class AdmissionControlMixinTestCase(TestCase):
+    @override_settings(
+        ADMISSION_CONTROL={
+            'ENABLED': True,
+            'MAX_CONCURRENT': 16,
+            'QUEUE_TIMEOUT': 1.0,
+            'RETRY_AFTER': 3,
+            'CLASSES': {
+                'roll': {'PRIORITY': 0, 'MAX_CONCURRENT': 1, 'MAX_QUEUE': 1},
+                'read': {'PRIORITY': 1, 'MAX_CONCURRENT': 1, 'MAX_QUEUE': 1},
+                'list': {'PRIORITY': 2, 'MAX_CONCURRENT': 0, 'MAX_QUEUE': 0}
+            }
+        }
+    )
+    def test_dispatch(self):
+        """
+        Test saturated endpoints are rejected with 503 and Retry-After
+        """
+        response = self.client.get('/games/')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '3')
+
+        response = self.client.post('/games/', {'player_names': ['name']})
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get('/admission/')
+        self.assertEqual(response.data['in_flight'], 0)
+        self.assertEqual(response.data['classes']['list']['rejected'], 1)
+        self.assertEqual(response.data['classes']['read']['admitted'], 1)
+
+    @override_settings(
+        ADMISSION_CONTROL={
+            'ENABLED': True,
+            'MAX_CONCURRENT': 16,
+            'QUEUE_TIMEOUT': 0.1,
+            'RETRY_AFTER': 1,
+            'CLASSES': {
+                'read': {'PRIORITY': 1, 'MAX_CONCURRENT': 1, 'MAX_QUEUE': 0}
+            }
+        }
+    )
+    def test_dispatch_streaming(self):
+        """
+        Test a streamed response holds its slot until it is closed
+        """
+        path = '/games/{}/?stream=true'.format(create_game([10, 3]).id)
+
+        response = self.client.get(path)
+        self.assertTrue(response.streaming)
+        self.assertEqual(self.client.get(path).status_code, 503)
+
+        b''.join(response.streaming_content)
+        stats = self.client.get('/admission/').data
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(stats['classes']['read']['in_flight'], 0)
+        self.assertEqual(self.client.get(path).status_code, 200)
+
+    @override_settings(
+        ADMISSION_CONTROL={
+            'ENABLED': False,
+            'MAX_CONCURRENT': 16,
+            'QUEUE_TIMEOUT': 1.0,
+            'RETRY_AFTER': 1,
+            'CLASSES': {}
+        }
+    )
+    def test_dispatch_disabled(self):
+        """
+        Test requests are not limited when admission control is disabled
+        """
+        self.assertEqual(self.client.get('/games/').status_code, 200)
+        self.assertEqual(self.client.get('/admission/').status_code, 404)
@@ -0,0 +1,158 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from scoring.archive import archive_games, pack_rows, unpack_rows
+from scoring.management.commands import archive_games as command
+from scoring.fast_serializers import (
+    serialize_game,
+    serialize_game_delta,
+    serialize_games
+)
+from scoring.models import (
+    ArchivedGame,
+    Frame,
+    Game,
+    GameSnapshot,
+    Player,
+    Roll
+)
+from scoring.tests.test_fast_serializers import create_game
+
+
+class ArchiveTestCase(TestCase):
+    def setUp(self):
+        self.game = create_game([10] * 12, [3, 7] * 10 + [5])
+        self.other_game = create_game([10, 3])
+
+    def test_pack_rows(self):
+        """
+        Test packed rows unpack to the original rows
+        """
+        player_rows = [{'id': 1, 'game_id': 2, 'name': 'alice'}]
+        frame_rows = [
+            {
+                'id': 3,
+                'player_id': 1,
+                'frame_number': 1,
+                'frame_type': Frame.STRIKE,
+                'version': 1
+            }
+        ]
+        roll_rows = [
+            {
+                'id': 4,
+                'frame_id': 3,
+                'roll_number': 1,
+                'pins_knocked_down': 10,
+                'sequence': 1
+            }
+        ]
+
+        self.assertEqual(
+            unpack_rows(2, pack_rows(player_rows, frame_rows, roll_rows)),
+            (player_rows, frame_rows, roll_rows)
+        )
+
+    def test_archive_games(self):
+        """
+        Test archived Games leave the hot tables and serialize unchanged
+        """
+        data = serialize_game(self.game)
+        delta = serialize_game_delta(self.game, 20)
+        other_data = serialize_game(self.other_game)
+
+        self.assertEqual(archive_games([self.game.id]), 1)
+
+        self.assertFalse(Player.objects.filter(game=self.game).exists())
+        self.assertFalse(Frame.objects.filter(player__game=self.game).exists())
+        self.assertFalse(
+            Roll.objects.filter(frame__player__game=self.game).exists()
+        )
+        self.assertEqual(serialize_game(self.game), data)
+        self.assertEqual(serialize_game_delta(self.game, 20), delta)
+        self.assertEqual(
+            serialize_games(Game.objects.order_by('id')), [data, other_data]
+        )
+
+    def test_retrieve_archived_game(self):
+        """
+        Test archived Games without a snapshot are retrieved from their
+        archive in the same response shape
+        """
+        path = '/games/{}/'.format(self.game.id)
+        response = self.client.get(path)
+        archive_games([self.game.id])
+        GameSnapshot.objects.filter(game=self.game).delete()
+
+        with patch(
+            'scoring.views.serialize_game', wraps=serialize_game
+        ) as mock_serialize_game:
+            self.assertEqual(self.client.get(path).content, response.content)
+
+        mock_serialize_game.assert_called_once_with(self.game)
+
+
+class ArchiveGamesCommandTestCase(TestCase):
+    def test_handle(self):
+        """
+        Test only Games finished before the cutoff are archived
+        """
+        old_game = create_game([10] * 12)
+        Game.objects.filter(id=old_game.id).update(
+            finished_at=timezone.now() - timedelta(days=31)
+        )
+        legacy_game = create_game([0] * 20)
+        Game.objects.filter(id=legacy_game.id).update(finished_at=None)
+        create_game([10] * 12)
+        create_game([10, 3])
+
+        out = StringIO()
+        call_command('archive_games', '--batch-size=1', stdout=out)
+
+        self.assertEqual(out.getvalue(), 'Archived 2 games in 2 batches\n')
+        self.assertEqual(
+            sorted(ArchivedGame.objects.values_list('game_id', flat=True)),
+            [old_game.id, legacy_game.id]
+        )
+
+    def test_handle_max_batches(self):
+        """
+        Test archiving stops after max_batches
+        """
+        for _ in range(3):
+            create_game([0] * 20)
+
+        call_command(
+            'archive_games', '--days=0', '--batch-size=1', '--max-batches=2',
+            stdout=StringIO()
+        )
+
+        self.assertEqual(ArchivedGame.objects.count(), 2)
+
+    @patch.object(command, 'compact_tables', return_value=True)
+    def test_handle_compact(self, mock_compact_tables):
+        """
+        Test the tables are only vacuumed when asked to
+        """
+        create_game([0] * 20)
+        create_game([0] * 20)
+
+        call_command(
+            'archive_games', '--days=0', '--max-batches=1',
+            '--batch-size=1', stdout=StringIO()
+        )
+        self.assertFalse(mock_compact_tables.called)
+
+        out = StringIO()
+        call_command('archive_games', '--days=0', '--compact', stdout=out)
+
+        mock_compact_tables.assert_called_once_with()
+        self.assertEqual(
+            out.getvalue(),
+            'Archived 1 games in 1 batches\nCompacted tables\n'
+        )
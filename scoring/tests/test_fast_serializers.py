@@ -0,0 +1,243 @@
+import random
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from scoring import fast_serializers
+from scoring.fast_serializers import (
+    get_player_score,
+    serialize_game,
+    serialize_game_delta,
+    serialize_games
+)
+from scoring.models import Frame, Game
+from scoring.serializers import CreateGameSerializer, GameSerializer
+
+
+def create_game(*player_pins):
+    """
+    Create a Game with a Player per list of pins and play their Rolls
+    """
+    serializer = CreateGameSerializer(
+        data={
+            'player_names': [
+                'player_{}'.format(index)
+                for index in range(len(player_pins))
+            ]
+        }
+    )
+    serializer.is_valid()
+    game = serializer.save()
+
+    for player, pins in zip(game.players.order_by('id'), player_pins):
+        for pins_knocked_down in pins:
+            player.make_roll(pins_knocked_down)
+
+    game.update_is_ongoing()
+    game.refresh_from_db()
+    return game
+
+
+def random_pins(rng):
+    """
+    Return the pins of a random, possibly unfinished, game for one Player
+    """
+    pins = []
+    for frame_number in range(1, 11):
+        first = rng.randint(0, 10)
+        pins.append(first)
+
+        if frame_number < 10:
+            if first < 10:
+                pins.append(rng.randint(0, 10 - first))
+            continue
+
+        second = rng.randint(0, 10 if first == 10 else 10 - first)
+        pins.append(second)
+        if first == 10 and second < 10:
+            pins.append(rng.randint(0, 10 - second))
+        elif first + second >= 10:
+            pins.append(rng.randint(0, 10))
+
+    return pins[:rng.randint(0, len(pins))]
+
+
+class FastSerializersTestCase(TestCase):
+    def assertSameJSON(self, fast_data, data):
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(fast_data), renderer.render(data))
+
+    def test_serialize_game(self):
+        """
+        Test serialize_game output is byte identical to GameSerializer
+        """
+        games = [
+            create_game([]),
+            create_game([3]),
+            create_game([10], [3, 7]),
+            create_game([10, 10], [10, 10, 10], [3, 7, 10]),
+            create_game([1, 2, 3, 4, 5, 5, 10, 0, 10, 10, 6]),
+            create_game([10] * 12, [9, 1] * 10 + [9], [0] * 20),
+            create_game([10] * 9 + [3, 4]),
+            create_game([0, 10] * 9 + [10, 0, 10])
+        ]
+
+        for game in games:
+            self.assertSameJSON(
+                serialize_game(game), GameSerializer(game).data
+            )
+
+    def test_serialize_game_random(self):
+        """
+        Test serialize_game output on random games
+        """
+        rng = random.Random(0)
+
+        for _ in range(20):
+            game = create_game(*[random_pins(rng) for _ in range(3)])
+            self.assertSameJSON(
+                serialize_game(game), GameSerializer(game).data
+            )
+
+    def test_serialize_games(self):
+        """
+        Test serialize_games output is byte identical to GameSerializer
+        and uses a constant number of queries
+        """
+        create_game([10, 3, 7], [])
+        create_game([1, 2])
+        create_game([10] * 12)
+
+        with self.assertNumQueries(5):
+            data = serialize_games(Game.objects.all())
+
+        self.assertSameJSON(
+            data, GameSerializer(Game.objects.all(), many=True).data
+        )
+
+    def test_get_player_score(self):
+        """
+        Test scoring serialized Frames with pending bonus Rolls
+        """
+        frames = [
+            {
+                'frame_number': 1,
+                'frame_type': Frame.STRIKE,
+                'rolls': [{'roll_number': 1, 'pins_knocked_down': 10}]
+            },
+            {
+                'frame_number': 2,
+                'frame_type': Frame.STRIKE,
+                'rolls': [{'roll_number': 1, 'pins_knocked_down': 10}]
+            }
+        ]
+        self.assertEqual(get_player_score(frames), 0)
+
+        frames.append(
+            {
+                'frame_number': 3,
+                'frame_type': Frame.ROLLING,
+                'rolls': [{'roll_number': 1, 'pins_knocked_down': 4}]
+            }
+        )
+        self.assertEqual(get_player_score(frames), 24)
+
+    def test_serialize_game_delta(self):
+        """
+        Test serializing the changes made after a version
+        """
+        game = create_game([10, 3], [4])
+        player_1, player_2 = game.players.order_by('id')
+
+        delta = serialize_game_delta(game, game.version)
+        self.assertEqual(delta['version'], 3)
+        self.assertEqual(
+            (delta['rolls'], delta['frames'], delta['players']), ([], [], [])
+        )
+
+        roll = player_1.make_roll(5)
+        game.refresh_from_db()
+
+        delta = serialize_game_delta(game, 3)
+        self.assertEqual(delta['version'], 4)
+        self.assertEqual(delta['since'], 3)
+        self.assertEqual(
+            delta['rolls'],
+            [
+                {
+                    'id': roll.id,
+                    'frame_id': roll.frame_id,
+                    'roll_number': 2,
+                    'pins_knocked_down': 5,
+                    'sequence': 4
+                }
+            ]
+        )
+        self.assertEqual(
+            delta['frames'], [{'id': roll.frame_id, 'frame_type': Frame.OPEN}]
+        )
+        self.assertEqual(delta['players'], [{'id': player_1.id, 'score': 26}])
+
+        delta = serialize_game_delta(game, 0)
+        self.assertEqual(len(delta['rolls']), 4)
+        self.assertEqual(
+            delta['players'],
+            [{'id': player_1.id, 'score': 26}, {'id': player_2.id, 'score': 0}]
+        )
+
+    def test_serialize_game_delta_concurrent_roll(self):
+        """
+        Test a Roll committed while a delta is read is left for the next
+        delta rather than reported without its score
+        """
+        game = create_game([3])
+        player = game.players.get()
+        build_players = fast_serializers.build_players
+
+        def build_players_then_roll(*args):
+            players_by_game = build_players(*args)
+            player.make_roll(4)
+            return players_by_game
+
+        with patch.object(
+            fast_serializers, 'build_players',
+            side_effect=build_players_then_roll
+        ):
+            delta = serialize_game_delta(game, 0)
+
+        self.assertEqual(delta['version'], 1)
+        self.assertEqual(len(delta['rolls']), 1)
+        self.assertEqual(delta['frames'], [])
+        self.assertEqual(delta['players'], [{'id': player.id, 'score': 0}])
+
+        game.refresh_from_db()
+        delta = serialize_game_delta(game, delta['version'])
+        self.assertEqual(delta['version'], 2)
+        self.assertEqual(delta['rolls'][0]['pins_knocked_down'], 4)
+        self.assertEqual(len(delta['frames']), 1)
+        self.assertEqual(delta['players'], [{'id': player.id, 'score': 7}])
+
+    def test_serialize_game_delta_concurrent_frame(self):
+        """
+        Test a Frame completed after the version of a delta is scored as
+        it was at that version
+        """
+        game = create_game([3])
+        player = game.players.get()
+        build_players = fast_serializers.build_players
+
+        def roll_then_build_players(*args):
+            player.make_roll(4)
+            return build_players(*args)
+
+        with patch.object(
+            fast_serializers, 'build_players',
+            side_effect=roll_then_build_players
+        ):
+            delta = serialize_game_delta(game, 0)
+
+        self.assertEqual(delta['version'], 1)
+        self.assertEqual(len(delta['rolls']), 1)
+        self.assertEqual(delta['frames'], [])
+        self.assertEqual(delta['players'], [{'id': player.id, 'score': 0}])
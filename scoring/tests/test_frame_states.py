@@ -0,0 +1,177 @@
+import random
+from itertools import product
+
+from django.test import SimpleTestCase
+
+from scoring.frame_states import (
+    OPEN,
+    ROLLING,
+    SPARE,
+    STRIKE,
+    TRANSITIONS,
+    InvalidRoll,
+    next_state,
+    validate_rolls
+)
+from scoring.tests.test_fast_serializers import random_pins
+
+
+PINS = range(-1, 12)
+
+
+def reference_frame_type(frame_number, rolls):
+    """
+    Get the frame_type of a Frame after rolls, applying the rules of
+    bowling directly
+    Return None if the last Roll is not possible
+    """
+    if not 0 <= rolls[-1] <= 10:
+        return None
+
+    if len(rolls) == 1:
+        if frame_number < 10 and rolls[0] == 10:
+            return STRIKE
+        return ROLLING
+
+    first, second = rolls[:2]
+
+    if len(rolls) == 2:
+        if first == 10:
+            return ROLLING
+        if first + second > 10:
+            return None
+        if first + second == 10:
+            return SPARE if frame_number < 10 else ROLLING
+        return OPEN
+
+    if first == 10 and second < 10 and second + rolls[2] > 10:
+        return None
+
+    return OPEN
+
+
+class FrameStatesTestCase(SimpleTestCase):
+    def test_every_frame_prefix(self):
+        """
+        Test every sequence of up to three Rolls in each Frame
+        """
+        for frame_number in range(1, 11):
+            for length in (1, 2, 3):
+                for rolls in product(PINS, repeat=length):
+                    self.check_frame(frame_number, rolls)
+
+    def check_frame(self, frame_number, rolls):
+        frame_type, rolls_made, pins_knocked_down = ROLLING, 0, 0
+
+        for index in range(len(rolls)):
+            state = (frame_number, rolls_made, pins_knocked_down)
+
+            if frame_type != ROLLING:
+                self.assertIsNone(next_state(*state, rolls[index]))
+                return
+
+            expected = reference_frame_type(frame_number, rolls[:index + 1])
+
+            if expected is None:
+                with self.assertRaises(InvalidRoll):
+                    next_state(*state, rolls[index])
+                return
+
+            frame_type, rolls_made, pins_knocked_down = next_state(
+                *state, rolls[index]
+            )
+            self.assertEqual(frame_type, expected, (frame_number, rolls))
+            self.assertEqual(rolls_made, index + 1)
+            self.assertEqual(pins_knocked_down, sum(rolls[:index + 1]))
+
+    def test_table(self):
+        """
+        Test the table holds every reachable state of a ROLLING Frame
+        """
+        self.assertEqual(
+            sorted(key for key in TRANSITIONS if key[0] == 1),
+            [(1, 0, 0)] + [(1, 1, pins) for pins in range(10)]
+        )
+        self.assertEqual(
+            sorted(key for key in TRANSITIONS if key[0] == 10),
+            [(10, 0, 0)] +
+            [(10, 1, pins) for pins in range(11)] +
+            [(10, 2, pins) for pins in range(10, 21)]
+        )
+        self.assertEqual(len(TRANSITIONS[(10, 2, 13)]), 8)
+        self.assertEqual(len(TRANSITIONS[(10, 2, 20)]), 11)
+
+    def test_validate_rolls(self):
+        """
+        Test validating the Rolls of whole games
+        """
+        self.assertEqual(validate_rolls([10] * 12), [STRIKE] * 9 + [OPEN])
+        self.assertEqual(
+            validate_rolls([3, 7] * 10 + [5]), [SPARE] * 9 + [OPEN]
+        )
+        self.assertEqual(validate_rolls([0] * 20), [OPEN] * 10)
+        self.assertEqual(validate_rolls([]), [ROLLING] * 10)
+        self.assertEqual(
+            validate_rolls([10, 3]), [STRIKE] + [ROLLING] * 9
+        )
+
+        rng = random.Random(0)
+        for _ in range(200):
+            pins = random_pins(rng)
+            frame_types = validate_rolls(pins)
+
+            self.assertEqual(len(frame_types), 10)
+            if pins and frame_types[-1] != ROLLING:
+                with self.assertRaises(InvalidRoll):
+                    validate_rolls(pins + [0])
+
+    def test_validate_rolls_invalid(self):
+        """
+        Test impossible Rolls are rejected with their position
+        """
+        cases = (
+            ([7, 7], 'Roll 2: Cannot knock down 7 pins with 3 pins standing'),
+            ([10, 11], 'Roll 2: Cannot knock down 11 pins with 10 pins '
+                       'standing'),
+            ([0] * 18 + [10, 5, 6], 'Roll 21: Cannot knock down 6 pins with '
+                                    '5 pins standing'),
+            ([0] * 18 + [3, 4, 5], 'Roll 21 comes after the last frame'),
+            ([10] * 13, 'Roll 13 comes after the last frame'),
+            ([-1], 'Roll 1: Cannot knock down -1 pins with 10 pins standing')
+        )
+
+        for rolls, message in cases:
+            with self.assertRaisesMessage(InvalidRoll, message):
+                validate_rolls(rolls)
+
+    def test_every_tenth_frame(self):
+        """
+        Test every sequence of Rolls in the tenth Frame of a whole game
+        """
+        for length in (1, 2, 3, 4):
+            for rolls in product(PINS, repeat=length):
+                self.check_game([10] * 9, list(rolls))
+                self.check_game([3, 4] * 9, list(rolls))
+
+    def check_game(self, rolls, tenth_frame_rolls):
+        try:
+            frame_types = validate_rolls(rolls + tenth_frame_rolls)
+        except InvalidRoll:
+            frame_types = None
+
+        expected = ROLLING
+        for index in range(len(tenth_frame_rolls)):
+            if expected == OPEN:
+                expected = None
+                break
+
+            expected = reference_frame_type(
+                10, tenth_frame_rolls[:index + 1]
+            )
+            if expected is None:
+                break
+
+        if expected is None:
+            self.assertIsNone(frame_types, tenth_frame_rolls)
+        else:
+            self.assertEqual(frame_types[-1], expected, tenth_frame_rolls)
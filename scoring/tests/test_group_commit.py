@@ -0,0 +1,224 @@
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import (
+    SimpleTestCase,
+    TransactionTestCase,
+    override_settings
+)
+from rest_framework.exceptions import NotFound, ParseError
+
+from scoring import group_commit
+from scoring.group_commit import RollWriter
+from scoring.models import Frame, Game, Player, Roll
+
+
+class RollWriterBatchTestCase(SimpleTestCase):
+    def test_batch_age(self):
+        """
+        Test a steady stream of Rolls does not hold a batch open beyond
+        interval after its first Roll
+        """
+        writer = RollWriter(interval=0.02)
+        ages = []
+
+        def apply(batch):
+            _, (submitted_at, _, _) = batch[0]
+            ages.append(time.monotonic() - submitted_at)
+
+        with patch.object(writer, '_apply', side_effect=apply):
+            for _ in range(300):
+                writer.submit(time.monotonic(), 1, 0)
+                time.sleep(0.001)
+
+            writer.stop()
+
+        self.assertGreater(len(ages), 1)
+        self.assertLess(max(ages), 0.1)
+
+
+class RollWriterTestCase(TransactionTestCase):
+    def setUp(self):
+        self.game = Game.objects.create()
+        self.players = []
+
+        for index in range(4):
+            player = Player.objects.create(
+                game=self.game, name='player_{}'.format(index)
+            )
+            Frame.objects.bulk_create(
+                [
+                    Frame(player=player, frame_number=frame_number)
+                    for frame_number in range(1, 11)
+                ]
+            )
+            self.players.append(player)
+
+        self.writer = RollWriter(interval=0.05)
+
+    def tearDown(self):
+        self.writer.stop()
+
+    def test_submit(self):
+        """
+        Test concurrent Rolls are applied in submission order per Player
+        """
+        pins = [1, 2, 3, 4, 0, 1, 2, 3, 4, 0]
+        results = []
+
+        def roll(player):
+            for pins_knocked_down in pins:
+                future = self.writer.submit(
+                    self.game.id, player.id, pins_knocked_down
+                )
+                results.append(future.result(timeout=5).pins_knocked_down)
+            connection.close()
+
+        threads = [
+            threading.Thread(target=roll, args=(player,))
+            for player in self.players
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), len(pins) * len(self.players))
+        for player in self.players:
+            self.assertEqual(
+                list(
+                    Roll.objects.filter(
+                        frame__player=player
+                    ).order_by('sequence').values_list(
+                        'pins_knocked_down', flat=True
+                    )
+                ),
+                pins
+            )
+
+    def test_submit_errors(self):
+        """
+        Test each request of a batch gets its own result or error
+        """
+        Frame.objects.filter(player=self.players[1]).update(
+            frame_type=Frame.OPEN
+        )
+
+        futures = [
+            self.writer.submit(self.game.id, self.players[0].id, 3),
+            self.writer.submit(self.game.id, 999, 3),
+            self.writer.submit(self.game.id, self.players[1].id, 3),
+            self.writer.submit(self.game.id, self.players[0].id, 4)
+        ]
+
+        self.assertEqual(futures[0].result(timeout=5).roll_number, 1)
+        self.assertIsInstance(futures[1].exception(timeout=5), NotFound)
+        self.assertIsInstance(futures[2].exception(timeout=5), ParseError)
+        self.assertEqual(futures[3].result(timeout=5).roll_number, 2)
+        self.assertEqual(Roll.objects.count(), 2)
+
+    def test_submit_failed_commit(self):
+        """
+        Test every request of a batch fails if its transaction fails
+        """
+        with patch.object(
+            group_commit.transaction, 'atomic',
+            side_effect=RuntimeError('commit failed')
+        ):
+            future = self.writer.submit(self.game.id, self.players[0].id, 3)
+            self.assertIsInstance(future.exception(timeout=5), RuntimeError)
+
+        self.assertEqual(Roll.objects.count(), 0)
+
+    @override_settings(
+        ROLL_GROUP_COMMIT={
+            'ENABLED': True,
+            'INTERVAL': 0.002,
+            'MAX_BATCH_SIZE': 256,
+            'TIMEOUT': 5,
+            'RETRY_AFTER': 1
+        }
+    )
+    def test_roll_create_api_view(self):
+        """
+        Test the roll endpoint applies Rolls through the RollWriter
+        """
+        with patch.object(group_commit, '_roll_writer', self.writer):
+            response = self.client.post(
+                '/games/{}/roll/'.format(self.game.id),
+                {'player_id': self.players[0].id, 'pins_knocked_down': 10}
+            )
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(response.data['pins_knocked_down'], 10)
+
+            response = self.client.post(
+                '/games/{}/roll/'.format(self.game.id),
+                {'player_id': 999, 'pins_knocked_down': 10}
+            )
+            self.assertEqual(response.status_code, 404)
+
+        self.assertIsNotNone(self.writer._thread)
+
+    @override_settings(
+        ROLL_GROUP_COMMIT={
+            'ENABLED': True,
+            'INTERVAL': 0.002,
+            'MAX_BATCH_SIZE': 256,
+            'TIMEOUT': 0.1,
+            'RETRY_AFTER': 1
+        }
+    )
+    def test_roll_create_api_view_timeout(self):
+        """
+        Test a Roll still queued after TIMEOUT is cancelled with a 503
+        """
+        path = '/games/{}/roll/'.format(self.game.id)
+        data = {'player_id': self.players[0].id, 'pins_knocked_down': 3}
+
+        with patch.object(group_commit, '_roll_writer', self.writer):
+            with patch.object(RollWriter, 'start'):
+                response = self.client.post(path, data)
+
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response['Retry-After'], '1')
+            self.assertEqual(self.writer._queue.qsize(), 1)
+
+            response = self.client.post(path, data)
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(response.data['roll_number'], 1)
+
+        self.assertEqual(Roll.objects.count(), 1)
+
+    @override_settings(
+        ROLL_GROUP_COMMIT={
+            'ENABLED': True,
+            'INTERVAL': 0.002,
+            'MAX_BATCH_SIZE': 256,
+            'TIMEOUT': 0.1,
+            'RETRY_AFTER': 1
+        }
+    )
+    def test_roll_create_api_view_timeout_running(self):
+        """
+        Test a Roll already being applied after TIMEOUT is waited for
+        """
+        roll = Roll(
+            frame=Frame.objects.filter(player=self.players[0]).first(),
+            pins_knocked_down=3, roll_number=1, id=1
+        )
+        future = Future()
+        future.set_running_or_notify_cancel()
+        timer = threading.Timer(0.3, future.set_result, args=(roll,))
+
+        with patch.object(RollWriter, 'submit', return_value=future):
+            timer.start()
+            response = self.client.post(
+                '/games/{}/roll/'.format(self.game.id),
+                {'player_id': self.players[0].id, 'pins_knocked_down': 3}
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['pins_knocked_down'], 3)
@@ -1,6 +1,7 @@
 from django.test import TestCase
 from unittest.mock import patch
 
+from scoring.frame_states import InvalidRoll
 from scoring.models import Frame, Game, Player, Roll
 
 
@@ -23,6 +24,22 @@ class GameTestCase(TestCase):
         self.game.update_is_ongoing()
         self.assertFalse(self.game.is_ongoing)
 
+    def test_update_is_ongoing_finished(self):
+        """
+        Test finished_at is only set when the Game finishes
+        """
+        self.frame.frame_type = Frame.STRIKE
+        self.frame.save()
+        self.game.update_is_ongoing()
+        finished_at = self.game.finished_at
+
+        game = Game.objects.get(id=self.game.id)
+        with self.assertNumQueries(0):
+            game.update_is_ongoing()
+
+        game.refresh_from_db()
+        self.assertEqual(game.finished_at, finished_at)
+
 
 class PlayerTestCase(TestCase):
     def setUp(self):
@@ -192,3 +209,54 @@ class FrameTestCase(TestCase):
         self.assertEqual(roll.frame, self.frame2)
         self.assertEqual(roll.pins_knocked_down, 10)
         self.assertEqual(roll.roll_number, 3)
+
+    def test_make_roll_invalid(self):
+        """
+        Test impossible Rolls are rejected without changing the Frame
+        """
+        self.frame.make_roll(7)
+
+        with self.assertRaises(InvalidRoll):
+            self.frame.make_roll(7)
+
+        self.frame.refresh_from_db()
+        self.assertEqual(self.frame.frame_type, Frame.ROLLING)
+        self.assertEqual(self.frame.rolls_made, 1)
+        self.assertEqual(self.frame.pins_knocked_down, 7)
+        self.assertEqual(self.frame.rolls.count(), 1)
+
+        self.frame2.frame_number = 10
+        self.frame2.save()
+        self.frame2.make_roll(10)
+        self.frame2.make_roll(5)
+
+        with self.assertRaises(InvalidRoll):
+            self.frame2.make_roll(6)
+
+        roll = self.frame2.make_roll(5)
+        self.assertEqual(self.frame2.frame_type, Frame.OPEN)
+        self.assertEqual(roll.roll_number, 3)
+        self.assertIsNone(self.frame2.make_roll(0))
+
+    def test_make_roll_versions(self):
+        """
+        Test Rolls are sequenced and Frames versioned per Game
+        """
+        roll_1 = self.frame.make_roll(3)
+        self.assertEqual(roll_1.sequence, 1)
+        self.assertEqual(self.frame.version, 0)
+
+        roll_2 = self.frame.make_roll(4)
+        self.assertEqual(roll_2.sequence, 2)
+        self.assertEqual(self.frame.version, 2)
+
+        other_player = Player.objects.create(game=self.game)
+        other_frame = Frame.objects.create(
+            player=other_player, frame_number=1
+        )
+        roll_3 = other_frame.make_roll(10)
+        self.assertEqual(roll_3.sequence, 3)
+        self.assertEqual(other_frame.version, 3)
+
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.version, 3)
@@ -0,0 +1,225 @@
+import json
+
+import msgpack
+from django.test import SimpleTestCase, TestCase
+
+from scoring.models import Frame, Game, Player, Roll
+from scoring.renderers import (
+    MessagePackRenderer,
+    PackedJSONRenderer,
+    PackedMessagePackRenderer,
+    pack_data
+)
+
+
+GAME_DATA = {
+    'id': 1,
+    'is_ongoing': True,
+    'players': [
+        {
+            'id': 1,
+            'name': 'alice',
+            'frames': [
+                {
+                    'id': 2,
+                    'frame_number': 2,
+                    'rolls': [
+                        {'id': 3, 'roll_number': 1, 'pins_knocked_down': 4}
+                    ],
+                    'frame_type': Frame.ROLLING
+                },
+                {
+                    'id': 1,
+                    'frame_number': 1,
+                    'rolls': [
+                        {'id': 2, 'roll_number': 2, 'pins_knocked_down': 7},
+                        {'id': 1, 'roll_number': 1, 'pins_knocked_down': 3}
+                    ],
+                    'frame_type': Frame.SPARE
+                }
+            ],
+            'score': 14
+        }
+    ]
+}
+
+
+class PackDataTestCase(SimpleTestCase):
+    def test_pack_game(self):
+        """
+        Test packing a Game orders pins and codes Frame types
+        """
+        packed = pack_data(GAME_DATA)
+
+        self.assertEqual(
+            packed,
+            {
+                'id': 1,
+                'is_ongoing': True,
+                'players': [[1, 'alice', [3, 7, 4], '/.', 14]]
+            }
+        )
+
+    def test_pack_delta(self):
+        """
+        Test packing a Game delta reduces Players to their scores
+        """
+        data = {
+            'id': 1,
+            'since': 0,
+            'rolls': [],
+            'frames': [],
+            'players': [{'id': 1, 'score': 14}]
+        }
+        packed = pack_data(data)
+
+        self.assertEqual(packed, dict(data, players=[[1, 14]]))
+
+    def test_pack_summary(self):
+        """
+        Test packing a Game summary keeps Player names and scores
+        """
+        data = {
+            'id': 1,
+            'is_ongoing': True,
+            'version': 2,
+            'players': [{'id': 1, 'name': 'alice', 'score': 14}]
+        }
+        packed = pack_data(data)
+
+        self.assertEqual(packed, dict(data, players=[[1, 'alice', 14]]))
+
+    def test_pack_list(self):
+        """
+        Test packing a list of Games
+        """
+        packed = pack_data([GAME_DATA, GAME_DATA])
+        self.assertEqual(packed, [pack_data(GAME_DATA)] * 2)
+
+    def test_pack_other(self):
+        """
+        Test data that is not a Game is left unchanged
+        """
+        data = {'detail': 'Game with id 1 not found'}
+        self.assertEqual(pack_data(data), data)
+
+
+class RendererTestCase(SimpleTestCase):
+    def test_message_pack_renderer(self):
+        """
+        Test MessagePack rendering of the full tree
+        """
+        content = MessagePackRenderer().render(GAME_DATA)
+        self.assertEqual(msgpack.unpackb(content, raw=False), GAME_DATA)
+        self.assertEqual(MessagePackRenderer().render(None), b'')
+
+    def test_packed_json_renderer(self):
+        """
+        Test JSON rendering of the packed representation
+        """
+        content = PackedJSONRenderer().render(GAME_DATA)
+        self.assertEqual(json.loads(content.decode()), pack_data(GAME_DATA))
+
+    def test_packed_message_pack_renderer(self):
+        """
+        Test MessagePack rendering of the packed representation
+        """
+        content = PackedMessagePackRenderer().render(GAME_DATA)
+        self.assertEqual(
+            msgpack.unpackb(content, raw=False), pack_data(GAME_DATA)
+        )
+
+
+class ContentNegotiationTestCase(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create()
+        self.player = Player.objects.create(game=self.game, name='alice')
+        self.frame = Frame.objects.create(player=self.player, frame_number=1)
+        Roll.objects.create(
+            frame=self.frame, pins_knocked_down=5, roll_number=1
+        )
+
+    def test_default_json(self):
+        """
+        Test JSON remains the default format
+        """
+        response = self.client.get('/games/{}/'.format(self.game.id))
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+    def test_accept_header(self):
+        """
+        Test the compact formats are selected with the Accept header
+        """
+        response = self.client.get(
+            '/games/{}/'.format(self.game.id),
+            HTTP_ACCEPT='application/vnd.bowling.packed+msgpack'
+        )
+        self.assertEqual(
+            response['Content-Type'], 'application/vnd.bowling.packed+msgpack'
+        )
+        self.assertEqual(
+            msgpack.unpackb(response.content, raw=False)['players'],
+            [[self.player.id, 'alice', [5], '.', 0]]
+        )
+
+    def test_format_query_parameter(self):
+        """
+        Test the compact formats are selected with the format parameter
+        """
+        response = self.client.get(
+            '/games/{}/?format=packed'.format(self.game.id)
+        )
+        self.assertEqual(
+            response['Content-Type'], 'application/vnd.bowling.packed+json'
+        )
+        self.assertEqual(
+            json.loads(response.content.decode())['players'],
+            [[self.player.id, 'alice', [5], '.', 0]]
+        )
+
+    def test_since(self):
+        """
+        Test the compact formats of the changes made since a version
+        """
+        path = '/games/{}/?since=0'.format(self.game.id)
+        Roll.objects.update(sequence=1)
+        Game.objects.update(version=1)
+        delta = self.client.get(path).data
+
+        response = self.client.get(path + '&format=packed')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content.decode())['players'],
+            [[self.player.id, 0]]
+        )
+
+        response = self.client.get(
+            path, HTTP_ACCEPT='application/vnd.bowling.packed+msgpack'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            msgpack.unpackb(response.content, raw=False),
+            json.loads(json.dumps(pack_data(delta)))
+        )
+
+    def test_batch_summary(self):
+        """
+        Test the compact formats of the summary projection
+        """
+        path = '/games/batch/?ids={}&projection=summary'.format(self.game.id)
+
+        response = self.client.get(path + '&format=packed')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content.decode())[0]['players'],
+            [[self.player.id, 'alice', 0]]
+        )
+
+        response = self.client.get(
+            path, HTTP_ACCEPT='application/vnd.bowling.packed+msgpack'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            msgpack.unpackb(response.content, raw=False)[0]['players'],
+            [[self.player.id, 'alice', 0]]
+        )
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.urls import Resolver404, resolve
+
+from scoring.views import GameRetrieveAPIView
+
+
+class URLsAPITestCase(SimpleTestCase):
+    def test_resolve(self):
+        """
+        Test the API URLconf routes the API without the admin
+        """
+        match = resolve('/games/1/', urlconf='scoring.urls_api')
+        self.assertEqual(match.func.view_class, GameRetrieveAPIView)
+
+        with self.assertRaises(Resolver404):
+            resolve('/admin/', urlconf='scoring.urls_api')
+
+
+class SettingsAPITestCase(SimpleTestCase):
+    def test_check(self):
+        """
+        Test the API only settings pass the system checks and do not load
+        the dropped apps
+        """
+        script = (
+            'import sys, django; django.setup(); '
+            'from django.core.management import call_command; '
+            'call_command("check"); '
+            'print("django.contrib.auth.models" in sys.modules)'
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='scoring.settings_api')
+        output = subprocess.check_output(
+            [sys.executable, '-c', script],
+            cwd=settings.BASE_DIR,
+            env=env,
+            stderr=subprocess.STDOUT
+        )
+
+        self.assertEqual(output.decode().split()[-1], 'False')
@@ -0,0 +1,140 @@
+import json
+import zlib
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from scoring.archive import archive_games
+from scoring.models import Game, GameSnapshot
+from scoring.renderers import pack_data
+from scoring.serializers import GameSerializer
+from scoring.snapshots import get_snapshot, get_snapshots, render_game
+from scoring.tests.test_fast_serializers import create_game
+
+
+class SnapshotsTestCase(TestCase):
+    def setUp(self):
+        self.finished_game = create_game([10] * 12, [3, 7] * 10 + [5])
+        self.ongoing_game = create_game([10, 3])
+
+    def test_create_snapshot(self):
+        """
+        Test finishing a Game stores its rendered JSON
+        """
+        self.assertEqual(
+            get_snapshot(self.finished_game),
+            JSONRenderer().render(GameSerializer(self.finished_game).data)
+        )
+        self.assertIsNone(get_snapshot(self.ongoing_game))
+        self.assertEqual(
+            get_snapshots(Game.objects.all()),
+            {self.finished_game.id: get_snapshot(self.finished_game)}
+        )
+
+    def test_retrieve(self):
+        """
+        Test retrieving a finished Game serves its snapshot
+        """
+        GameSnapshot.objects.filter(game=self.finished_game).update(
+            data=zlib.compress(b'{"id":1,"players":[]}')
+        )
+        path = '/games/{}/'.format(self.finished_game.id)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(path)
+
+        self.assertEqual(response.content, b'{"id":1,"players":[]}')
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        response = self.client.get(path + '?format=packed')
+        self.assertEqual(
+            json.loads(response.content.decode()),
+            {'id': 1, 'players': []}
+        )
+
+    def test_roll_on_finished_game(self):
+        """
+        Test a rejected Roll on a finished Game leaves its snapshot alone
+        """
+        GameSnapshot.objects.filter(game=self.finished_game).update(
+            data=zlib.compress(b'{}')
+        )
+        player = self.finished_game.players.first()
+
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                '/games/{}/roll/'.format(self.finished_game.id),
+                {'player_id': player.id, 'pins_knocked_down': 3}
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(get_snapshot(self.finished_game), b'{}')
+
+    def test_list(self):
+        """
+        Test listing Games serves snapshots alongside live Games
+        """
+        with self.assertNumQueries(6):
+            response = self.client.get('/games/')
+
+        data = GameSerializer(Game.objects.order_by('id'), many=True).data
+        self.assertEqual(response.content, JSONRenderer().render(data))
+
+        response = self.client.get('/games/?format=packed')
+        self.assertEqual(
+            json.loads(response.content.decode()),
+            json.loads(json.dumps(pack_data(data)))
+        )
+
+
+class SnapshotGamesCommandTestCase(TestCase):
+    def setUp(self):
+        self.games = [create_game([10] * 12), create_game([0] * 20)]
+        create_game([10, 3])
+
+    def test_backfill(self):
+        """
+        Test snapshots are stored for finished Games without one
+        """
+        GameSnapshot.objects.all().delete()
+
+        out = StringIO()
+        call_command('snapshot_games', stdout=out)
+
+        self.assertEqual(out.getvalue(), 'Stored 2 snapshots\n')
+        self.assertEqual(
+            sorted(GameSnapshot.objects.values_list('game_id', flat=True)),
+            [game.id for game in self.games]
+        )
+
+    def test_check(self):
+        """
+        Test stored snapshots are compared with the live output
+        """
+        archive_games([self.games[0].id])
+
+        out = StringIO()
+        call_command('snapshot_games', '--check', stdout=out)
+        self.assertEqual(out.getvalue(), 'Checked 2 snapshots\n')
+
+        GameSnapshot.objects.filter(game=self.games[1]).update(
+            data=zlib.compress(b'{}')
+        )
+
+        with self.assertRaisesMessage(
+            CommandError,
+            'Snapshots of games {} do not match'.format(self.games[1].id)
+        ):
+            call_command('snapshot_games', '--check', stdout=StringIO())
+
+    def test_render_game(self):
+        """
+        Test the rendered JSON matches GameSerializer
+        """
+        for game in Game.objects.all():
+            self.assertEqual(
+                render_game(game),
+                JSONRenderer().render(GameSerializer(game).data)
+            )
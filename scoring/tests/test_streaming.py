@@ -0,0 +1,77 @@
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from scoring.archive import archive_games
+from scoring.fast_serializers import serialize_game
+from scoring.models import Game
+from scoring.streaming import iter_game_json, iter_players
+from scoring.tests.test_fast_serializers import create_game
+
+
+class StreamingTestCase(TestCase):
+    def setUp(self):
+        self.game = create_game(
+            [10, 3, 7], [], [1, 2, 3], [10] * 12, [0] * 20
+        )
+
+    def test_iter_players(self):
+        """
+        Test Players are yielded in chunks with three queries each
+        """
+        with self.assertNumQueries(9):
+            chunks = list(iter_players(self.game, 2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            [player for chunk in chunks for player in chunk],
+            serialize_game(self.game)['players']
+        )
+
+    def test_iter_game_json(self):
+        """
+        Test streamed JSON is byte identical to the rendered Game
+        """
+        content = JSONRenderer().render(serialize_game(self.game))
+
+        for chunk_size in (1, 2, 5, 500):
+            self.assertEqual(
+                b''.join(iter_game_json(self.game, chunk_size)), content
+            )
+
+    def test_iter_game_json_archived(self):
+        """
+        Test streaming an archived Game
+        """
+        game = create_game([10] * 12, [0] * 20, [3, 7] * 10 + [5])
+        content = JSONRenderer().render(serialize_game(game))
+        archive_games([game.id])
+
+        self.assertEqual(b''.join(iter_game_json(game, 2)), content)
+
+    def test_iter_game_json_no_players(self):
+        """
+        Test streaming a Game without Players
+        """
+        game = Game.objects.create()
+
+        self.assertEqual(
+            b''.join(iter_game_json(game)),
+            JSONRenderer().render(serialize_game(game))
+        )
+
+    def test_retrieve_stream(self):
+        """
+        Test retrieving a streamed Game
+        """
+        path = '/games/{}/'.format(self.game.id)
+        response = self.client.get(path + '?stream=true')
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            b''.join(response.streaming_content),
+            self.client.get(path).content
+        )
+
+        response = self.client.get(path + '?stream=true&format=packed')
+        self.assertFalse(response.streaming)
@@ -29,6 +29,140 @@ class GameListCreateAPIViewTestCase(TestCase):
         )
 
 
+class GameRetrieveAPIViewTestCase(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create()
+        self.player = Player.objects.create(game=self.game, name='player_name')
+        self.frame = Frame.objects.create(player=self.player, frame_number=1)
+
+    def test_get(self):
+        """
+        Test retrieving the full Game
+        """
+        self.frame.make_roll(3)
+
+        response = self.client.get('/games/{}/'.format(self.game.id))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['version'], 1)
+        self.assertEqual(len(response.data['players']), 1)
+
+    def test_get_since(self):
+        """
+        Test retrieving the changes made to a Game since a version
+        """
+        self.frame.make_roll(3)
+        roll = self.frame.make_roll(4)
+
+        response = self.client.get(
+            '/games/{}/?since=1'.format(self.game.id)
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['version'], 2)
+        self.assertEqual(
+            [roll_data['id'] for roll_data in response.data['rolls']],
+            [roll.id]
+        )
+        self.assertEqual(
+            response.data['players'], [{'id': self.player.id, 'score': 7}]
+        )
+
+    def test_get_since_invalid(self):
+        """
+        Test retrieving changes with an invalid version
+        """
+        for since in ('-1', 'abc'):
+            response = self.client.get(
+                '/games/{}/?since={}'.format(self.game.id, since)
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.data,
+                {'detail': 'since must be a non-negative integer'}
+            )
+
+
+class GameBatchRetrieveAPIViewTestCase(TestCase):
+    def setUp(self):
+        self.games = [Game.objects.create() for _ in range(3)]
+
+        for game in self.games:
+            player = Player.objects.create(game=game, name='player_name')
+            frame = Frame.objects.create(player=player, frame_number=1)
+            frame.make_roll(4)
+
+    def test_get(self):
+        """
+        Test retrieving Games in the requested order with constant queries
+        """
+        ids = [self.games[2].id, self.games[0].id, self.games[2].id, 999]
+
+        with self.assertNumQueries(5):
+            response = self.client.get(
+                '/games/batch/?ids={}'.format(','.join(map(str, ids)))
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [game['id'] for game in response.data],
+            [self.games[2].id, self.games[0].id]
+        )
+        self.assertEqual(len(response.data[0]['players'][0]['frames']), 1)
+
+    def test_get_summary(self):
+        """
+        Test retrieving the summary projection of Games
+        """
+        response = self.client.get(
+            '/games/batch/?ids={}&projection=summary'.format(
+                self.games[0].id
+            )
+        )
+
+        player = self.games[0].players.get()
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    'id': self.games[0].id,
+                    'is_ongoing': True,
+                    'version': 1,
+                    'players': [
+                        {'id': player.id, 'name': 'player_name', 'score': 0}
+                    ]
+                }
+            ]
+        )
+
+    def test_get_invalid(self):
+        """
+        Test retrieving Games with invalid parameters
+        """
+        response = self.client.get('/games/batch/')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get('/games/batch/?ids=1,a')
+        self.assertEqual(
+            response.data,
+            {'detail': 'ids must be a comma separated list of game ids'}
+        )
+
+        response = self.client.get(
+            '/games/batch/?ids={}'.format(','.join(map(str, range(101))))
+        )
+        self.assertEqual(
+            response.data,
+            {'detail': 'At most 100 games may be retrieved at once'}
+        )
+
+        response = self.client.get('/games/batch/?ids=1&projection=packed')
+        self.assertEqual(
+            response.data,
+            {'detail': 'projection must be one of full, summary'}
+        )
+
+
 class RollCreateAPIViewTestCase(TestCase):
     def setUp(self):
         self.game = Game.objects.create()
@@ -86,3 +220,19 @@ class RollCreateAPIViewTestCase(TestCase):
             {'detail': 'player_name has exhausted all their rolls'}
         )
         self.assertEqual(response.status_code, 400)
+
+    def test_post_impossible(self):
+        """
+        Test creating a Roll of more pins than are standing
+        """
+        path = '/games/{}/roll/'.format(self.game.id)
+        data = {'player_id': self.player.id, 'pins_knocked_down': 7}
+        self.client.post(path, data)
+
+        response = self.client.post(path, data)
+        self.assertEqual(
+            response.data,
+            {'detail': 'Cannot knock down 7 pins with 3 pins standing'}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Roll.objects.count(), 1)
@@ -0,0 +1,21 @@
+"""scoring API URL Configuration
+
+The API routes without the admin, for use with scoring.settings_api
+"""
+from django.urls import path, re_path
+
+from scoring.views import (
+    AdmissionStatsAPIView,
+    GameBatchRetrieveAPIView,
+    GameListCreateAPIView,
+    GameRetrieveAPIView,
+    RollCreateAPIView
+)
+
+urlpatterns = [
+    path('games/', GameListCreateAPIView.as_view()),
+    path('games/batch/', GameBatchRetrieveAPIView.as_view()),
+    re_path(r'games/(?P<pk>\d+)/$', GameRetrieveAPIView.as_view()),
+    re_path(r'games/(?P<game_id>\d+)/roll/$', RollCreateAPIView.as_view()),
+    path('admission/', AdmissionStatsAPIView.as_view())
+]
@@ -1,26 +1,85 @@
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework import generics, status
 from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from scoring.models import Game, Player
+from scoring.admission import (
+    AdmissionControlMixin,
+    ServiceUnavailable,
+    get_admission_controller
+)
+from scoring.fast_serializers import (
+    serialize_game,
+    serialize_game_delta,
+    serialize_games,
+    summarize_game
+)
+from scoring.models import Game
+from scoring.rolls import apply_roll
 from scoring.serializers import (
     CreateGameSerializer,
     CreateRollSerializer,
     GameSerializer,
     RollSerializer
 )
+from scoring.snapshots import get_snapshot, get_snapshots
 
 
-class GameListCreateAPIView(generics.ListCreateAPIView):
+class GameListCreateAPIView(
+    AdmissionControlMixin, generics.ListCreateAPIView
+):
     queryset = Game.objects.all()
 
+    def get_admission_class(self):
+        if self.request.method == 'POST':
+            return 'read'
+
+        return 'list'
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         game = serializer.save()
 
         return Response(
-            GameSerializer(game).data, status=status.HTTP_201_CREATED
+            serialize_game(game), status=status.HTTP_201_CREATED
+        )
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        snapshots = get_snapshots(queryset)
+        games = {
+            game['id']: game
+            for game in serialize_games(
+                queryset.filter(snapshot__isnull=True)
+            )
+        }
+        ids = sorted(set(games) | set(snapshots))
+
+        if request.accepted_renderer.format != 'json':
+            return Response(
+                [
+                    json.loads(snapshots[game_id].decode())
+                    if game_id in snapshots else games[game_id]
+                    for game_id in ids
+                ]
+            )
+
+        content = b','.join(
+            [
+                snapshots[game_id] if game_id in snapshots
+                else request.accepted_renderer.render(games[game_id])
+                for game_id in ids
+            ]
+        )
+        return HttpResponse(
+            b'[' + content + b']',
+            content_type=request.accepted_renderer.media_type
         )
 
     def get_serializer_class(self):
@@ -30,41 +89,171 @@ class GameListCreateAPIView(generics.ListCreateAPIView):
         return GameSerializer
 
 
-class GameRetrieveAPIView(generics.RetrieveAPIView):
+class GameRetrieveAPIView(AdmissionControlMixin, generics.RetrieveAPIView):
     queryset = Game.objects.all()
     serializer_class = GameSerializer
+    admission_class = 'read'
 
+    def get_since(self):
+        """
+        Get the version passed in the since query parameter
+        Return None if it was not passed
+        """
+        since = self.request.query_params.get('since')
 
-class RollCreateAPIView(generics.CreateAPIView):
-    serializer_class = CreateRollSerializer
-
-    def post(self, request, game_id):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        validated_data = serializer.validated_data
+        if since is None:
+            return None
 
         try:
-            game = Game.objects.get(id=game_id)
-        except Game.DoesNotExist:
-            raise NotFound('Game with id {} not found'.format(game_id))
+            since = int(since)
+        except ValueError:
+            since = -1
+
+        if since < 0:
+            raise ParseError('since must be a non-negative integer')
+
+        return since
+
+    def retrieve(self, request, *args, **kwargs):
+        since = self.get_since()
+        game = self.get_object()
+
+        if since is not None:
+            return Response(serialize_game_delta(game, since))
+
+        snapshot = get_snapshot(game)
+
+        if snapshot is not None:
+            if request.accepted_renderer.format != 'json':
+                return Response(json.loads(snapshot.decode()))
+
+            return HttpResponse(
+                snapshot, content_type=request.accepted_renderer.media_type
+            )
+
+        if (
+            request.query_params.get('stream') == 'true' and
+            request.accepted_renderer.format == 'json'
+        ):
+            from scoring.streaming import iter_game_json
+
+            return StreamingHttpResponse(
+                iter_game_json(game, settings.STREAMING_CHUNK_SIZE),
+                content_type=request.accepted_renderer.media_type
+            )
+
+        return Response(serialize_game(game))
+
+
+class GameBatchRetrieveAPIView(
+    AdmissionControlMixin, generics.GenericAPIView
+):
+    queryset = Game.objects.all()
+    admission_class = 'list'
+    max_ids = 100
+    projections = ('full', 'summary')
+
+    def get_ids(self):
+        """
+        Get the distinct Game ids passed in the ids query parameter
+        """
+        ids = self.request.query_params.get('ids', '')
 
         try:
-            player = game.players.get(id=validated_data['player_id'])
-        except Player.DoesNotExist:
-            raise NotFound(
-                'Player with id {} not found.'.format(
-                    validated_data['player_id']
+            ids = [int(game_id) for game_id in ids.split(',')]
+        except ValueError:
+            raise ParseError('ids must be a comma separated list of game ids')
+
+        ids = list(OrderedDict.fromkeys(ids))
+
+        if len(ids) > self.max_ids:
+            raise ParseError(
+                'At most {} games may be retrieved at once'.format(
+                    self.max_ids
                 )
             )
 
-        roll = player.make_roll(validated_data['pins_knocked_down'])
-        game.update_is_ongoing()
+        return ids
+
+    def get_projection(self):
+        projection = self.request.query_params.get('projection', 'full')
 
-        if roll is None:
+        if projection not in self.projections:
             raise ParseError(
-                '{} has exhausted all their rolls'.format(player.name)
+                'projection must be one of {}'.format(
+                    ', '.join(self.projections)
+                )
             )
 
+        return projection
+
+    def get(self, request):
+        ids = self.get_ids()
+        projection = self.get_projection()
+
+        positions = {game_id: position for position, game_id in enumerate(ids)}
+        games = serialize_games(self.get_queryset().filter(id__in=ids))
+        games.sort(key=lambda game: positions[game['id']])
+
+        if projection == 'summary':
+            games = [summarize_game(game) for game in games]
+
+        return Response(games)
+
+
+class RollCreateAPIView(AdmissionControlMixin, generics.CreateAPIView):
+    serializer_class = CreateRollSerializer
+    admission_class = 'roll'
+
+    def submit_roll(self, *args):
+        """
+        Apply a Roll through the RollWriter and return it
+        Raise ServiceUnavailable if it was cancelled before being applied
+        within TIMEOUT
+        """
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        from scoring.group_commit import get_roll_writer
+
+        future = get_roll_writer().submit(*args)
+
+        try:
+            return future.result(
+                timeout=settings.ROLL_GROUP_COMMIT['TIMEOUT']
+            )
+        except FutureTimeoutError:
+            if future.cancel():
+                raise ServiceUnavailable(
+                    wait=settings.ROLL_GROUP_COMMIT['RETRY_AFTER']
+                )
+
+            return future.result()
+
+    def post(self, request, game_id):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
+        args = (
+            game_id,
+            validated_data['player_id'],
+            validated_data['pins_knocked_down']
+        )
+
+        if settings.ROLL_GROUP_COMMIT['ENABLED']:
+            roll = self.submit_roll(*args)
+        else:
+            roll = apply_roll(*args)
+
         return Response(
             RollSerializer(roll).data, status=status.HTTP_201_CREATED
         )
+
+
+class AdmissionStatsAPIView(APIView):
+    def get(self, request):
+        controller = get_admission_controller()
+
+        if controller is None:
+            raise NotFound('Admission control is disabled')
+
+        return Response(controller.get_stats())